@@ -7,10 +7,12 @@ class AssetsConfig(AppConfig):
 
     def ready(self) -> None:
         ready = super().ready()
-        from assets.signals import create_asset  # noqa
+        from assets.signals import clear_asset_content_type_cache, create_asset  # noqa
         from .models import Equipment, Attachment  # noqa
-        from django.db.models.signals import post_save
+        from django.db.models.signals import post_delete, post_save
 
         post_save.connect(receiver=create_asset, sender=Equipment, weak=False, dispatch_uid="Assets_create_equipment")
         post_save.connect(receiver=create_asset, sender=Attachment, weak=False, dispatch_uid="Assets_create_attachment")
+        post_delete.connect(receiver=clear_asset_content_type_cache, sender=Equipment, weak=False, dispatch_uid="Assets_clear_equipment_ct")
+        post_delete.connect(receiver=clear_asset_content_type_cache, sender=Attachment, weak=False, dispatch_uid="Assets_clear_attachment_ct")
         return ready
\ No newline at end of file
@@ -19,8 +19,8 @@ class AssetBaseSerializer(FileAttachmentSerializerMixin, BaseSerializer):
     def mod_to_representation(self, instance):
         response = super().mod_to_representation(instance)
         response['id'] = str(instance.id)
-        response['location'] = LocationBaseSerializer(instance.location).data
-        response['site'] = SiteBaseSerializer(instance.location.site).data
+        response['location'] = LocationBaseSerializer.represent(instance.location)
+        response['site'] = SiteBaseSerializer.represent(instance.location.site)
         response['category'] = {
             "id": str(instance.category.id),
             "name": instance.category.name,
@@ -30,16 +30,16 @@ class AssetBaseSerializer(FileAttachmentSerializerMixin, BaseSerializer):
         # Use serializers for project, account_code, job_code, asset_status
         response['project'] = None
         if getattr(instance, 'project', None):
-            response['project'] = ProjectBaseSerializer(instance.project).data
+            response['project'] = ProjectBaseSerializer.represent(instance.project)
         response['account_code'] = None
         if getattr(instance, 'account_code', None):
-            response['account_code'] = AccountCodeBaseSerializer(instance.account_code).data
+            response['account_code'] = AccountCodeBaseSerializer.represent(instance.account_code)
         response['job_code'] = None
         if getattr(instance, 'job_code', None):
-            response['job_code'] = JobCodeBaseSerializer(instance.job_code).data
+            response['job_code'] = JobCodeBaseSerializer.represent(instance.job_code)
         response['asset_status'] = None
         if getattr(instance, 'asset_status', None):
-            response['asset_status'] = AssetStatusBaseSerializer(instance.asset_status).data
+            response['asset_status'] = AssetStatusBaseSerializer.represent(instance.asset_status)
         response['created_at'] = instance.created_at
         response['updated_at'] = instance.updated_at
         response['purchase_date'] = instance.purchase_date
@@ -49,7 +49,7 @@ class AssetBaseSerializer(FileAttachmentSerializerMixin, BaseSerializer):
         # - files: File counts, endpoints, upload examples
         
         if hasattr(instance, 'equipment'):
-            response['equipment'] = EquipmentBaseSerializer(instance.equipment).data
+            response['equipment'] = EquipmentBaseSerializer.represent(instance.equipment)
         return response
 
 
@@ -67,7 +67,7 @@ class EquipmentBaseSerializer(AssetBaseSerializer):
     def mod_to_representation(self, instance): 
         response = super().mod_to_representation(instance)
         response['type'] = 'equipment'
-        response['weight_class'] = EquipmentWeightClassBaseSerializer(instance.weight_class).data if instance.weight_class else None
+        response['weight_class'] = EquipmentWeightClassBaseSerializer.represent(instance.weight_class) if instance.weight_class else None
         return response
 
 
@@ -101,9 +101,9 @@ class AssetMoveBaseSerializer(BaseSerializer):
 
     def mod_to_representation(self, instance):
         response = super().mod_to_representation(instance)
-        response['from_location'] = LocationBaseSerializer(instance.from_location).data if instance.from_location else None
-        response['to_location'] = LocationBaseSerializer(instance.to_location).data if instance.to_location else None
-        response['moved_by'] = TenantUserBaseSerializer(instance.moved_by).data if instance.moved_by else None
+        response['from_location'] = LocationBaseSerializer.represent(instance.from_location) if instance.from_location else None
+        response['to_location'] = LocationBaseSerializer.represent(instance.to_location) if instance.to_location else None
+        response['moved_by'] = TenantUserBaseSerializer.represent(instance.moved_by) if instance.moved_by else None
         return response
 
 
@@ -115,12 +115,12 @@ class AssetOnlineStatusLogBaseSerializer(BaseSerializer):
     def mod_to_representation(self, instance):
         response = super().mod_to_representation(instance)
         # Expand related fields for convenience
-        response['offline_user'] = TenantUserBaseSerializer(instance.offline_user).data if instance.offline_user else None
-        response['online_user'] = TenantUserBaseSerializer(instance.online_user).data if instance.online_user else None
+        response['offline_user'] = TenantUserBaseSerializer.represent(instance.offline_user) if instance.offline_user else None
+        response['online_user'] = TenantUserBaseSerializer.represent(instance.online_user) if instance.online_user else None
         # Lazy imports to avoid circular import with assets.services and work_orders serializers
         from work_orders.platforms.base.serializers import WorkOrderBaseSerializer as _WorkOrderBaseSerializer
         from assets.services import get_asset_serializer as _get_asset_serializer
-        response['work_order'] = _WorkOrderBaseSerializer(instance.work_order).data if instance.work_order else None
+        response['work_order'] = _WorkOrderBaseSerializer.represent(instance.work_order) if instance.work_order else None
         asset = get_object_by_content_type_and_id(instance.content_type.id, instance.object_id)
         response['asset'] = _get_asset_serializer(asset).data if asset else None
         # Business rule: if no online_user yet, updated_at should be null in API response
@@ -1,22 +1,22 @@
 from assets.services import get_assets_by_gfk, get_content_type_and_asset_id, move_asset
 from configurations.base_features.exceptions.base_exceptions import LocalBaseException
 from configurations.base_features.views.base_api_view import BaseAPIView
-from configurations.mixins.file_attachment_mixins import FileAttachmentViewMixin
+from configurations.mixins.file_attachment_mixins import FileAttachmentQuerysetMixin, FileAttachmentViewMixin
 from assets.models import *
 from assets.platforms.base.serializers import *
 from django.utils.translation import gettext_lazy as _
 from django.contrib.contenttypes.models import ContentType
 
 
-class AssetBaseView(FileAttachmentViewMixin, BaseAPIView):
+class AssetBaseView(FileAttachmentQuerysetMixin, FileAttachmentViewMixin, BaseAPIView):
     serializer_class = AssetBaseSerializer
     model_class = Equipment
     http_method_names = ["get", "post", "put", "patch", "delete"]
 
     def list(self, request, *args, **kwargs):
-        equipments_instance = Equipment.objects.all()
+        equipments_instance = self.with_file_info(Equipment.objects.all())
         equipments = list(EquipmentBaseSerializer(equipments_instance, many=True).data)
-        attachments_instance = Attachment.objects.all()
+        attachments_instance = self.with_file_info(Attachment.objects.all())
         attachments = list(AttachmentBaseSerializer(attachments_instance, many=True).data)
         response = sorted(equipments + attachments, key=lambda x: x['created_at'], reverse=True)
         return self.format_response(data=response, status_code=200)
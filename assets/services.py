@@ -1,6 +1,10 @@
+from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import connection
 from assets.models import *
 from typing import Union
+from uuid import UUID
 from django.db.models import Model
 
 from assets.platforms.base.serializers import AssetBaseSerializer, AttachmentBaseSerializer, EquipmentBaseSerializer
@@ -20,12 +24,29 @@ def get_assets_by_gfk(model_class, id, *q_params, **params):
     return get_objects_by_gfk(model_class, id, [Equipment, Attachment],  *q_params, **params)
 
 
+def asset_content_type_cache_key(asset_id) -> str:
+    """Cache key holding the content type id of an asset id in the current schema."""
+    return f"asset_ct:{connection.schema_name}:{asset_id}"
+
+
 def get_content_type_and_asset_id(
     obj_or_id: Union[Model, str],
     return_ct_instance=False,
     return_instance=False
 ) -> tuple[int, str]:
-    return get_content_type_and_object_id(obj_or_id, [Equipment, Attachment], return_ct_instance=return_ct_instance, return_instance=return_instance)
+    if return_instance or not isinstance(obj_or_id, (str, UUID)):
+        return get_content_type_and_object_id(obj_or_id, [Equipment, Attachment], return_ct_instance=return_ct_instance, return_instance=return_instance)
+
+    # An asset id always belongs to the same model, so the probe result is cached;
+    # entries are dropped when the asset is deleted (assets.signals)
+    key = asset_content_type_cache_key(obj_or_id)
+    ct_id = cache.get(key)
+    if ct_id is None:
+        ct_id, _ = get_content_type_and_object_id(obj_or_id, [Equipment, Attachment])
+        cache.set(key, ct_id, timeout=settings.ASSET_CONTENT_TYPE_CACHE_TTL)
+    if return_ct_instance:
+        return ContentType.objects.get_for_id(ct_id), obj_or_id
+    return ct_id, obj_or_id
 
 
 def move_asset(asset, from_location, to_location, user=None):
@@ -1,6 +1,7 @@
 
 # from django.dispatch import receiver
-from assets.services import get_content_type_and_asset_id
+from django.core.cache import cache
+from assets.services import asset_content_type_cache_key, get_content_type_and_asset_id
 from financial_reports.models import CapitalCost
 
 
@@ -8,4 +9,8 @@ from financial_reports.models import CapitalCost
 def create_asset(sender, instance, created, **kwargs):
     if created:
         ct, obj_id = get_content_type_and_asset_id(instance.id, return_ct_instance=True)
-        CapitalCost.objects.create(object_id=obj_id, content_type=ct)
\ No newline at end of file
+        CapitalCost.objects.create(object_id=obj_id, content_type=ct)
+
+
+def clear_asset_content_type_cache(sender, instance, **kwargs):
+    cache.delete(asset_content_type_cache_key(instance.pk))
\ No newline at end of file
@@ -15,7 +15,7 @@ class LocationBaseSerializer(BaseSerializer):
 
     def to_representation(self, instance):
         response = super().to_representation(instance)
-        response['site'] = SiteBaseSerializer(instance.site).data
+        response['site'] = SiteBaseSerializer.represent(instance.site)
         response["name"] = f"{instance.site.code} - {instance.name}",
         return response
 
@@ -23,7 +23,7 @@ class ComponentBaseSerializer(BaseSerializer):
         
         # Add work order information
         if instance.work_order:
-            response['work_order'] = WorkOrderBaseSerializer(instance.work_order).data
+            response['work_order'] = WorkOrderBaseSerializer.represent(instance.work_order)
         
         # Add files information
         files = instance.files.all()
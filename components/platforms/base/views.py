@@ -1,11 +1,124 @@
+import hashlib
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ValidationError
+from django.db.models import Count, F, Func, Max, OuterRef, Subquery, TextField, Value
+from django.db.models.functions import Cast
+from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+
+from assets.models import Attachment, Equipment
 from configurations.base_features.views.base_api_view import BaseAPIView
 from configurations.base_features.exceptions.base_exceptions import LocalBaseException
+from file_uploads.models import FileUpload
+from meter_readings.models import MeterReading
+from work_orders.models import WorkOrder
 from components.models import *
 from components.platforms.base.serializers import *
 
 
+# relations each serializer renders next to the row itself ("")
+_ASSET_PATHS = ("", "location", "location__site", "category", "project", "account_code", "job_code",
+                "asset_status", "image")
+_EQUIPMENT_PATHS = (*_ASSET_PATHS, "weight_class")
+# an attachment also renders its equipment in full
+_ATTACHMENT_PATHS = (*_ASSET_PATHS, *(f"equipment__{path}" if path else "equipment" for path in _EQUIPMENT_PATHS))
+_WORK_ORDER_PATHS = ("", "status", "status__control", "maint_type", "maint_type__hlmtype", "priority")
+
+
+class _Concat(Func):
+    """PostgreSQL CONCAT(): one flat call, NULL arguments count as empty strings"""
+    function = "CONCAT"
+    output_field = TextField()
+
+
+def _sep(separator):
+    # typed, so CONCAT never sees an unknown-typed parameter
+    return Cast(Value(separator), output_field=TextField())
+
+
+def _rows_state(paths):
+    """id and updated_at of the row and of each related path, as one text column (NULLs empty)"""
+    parts = []
+    for path in paths:
+        prefix = f"{path}__" if path else ""
+        parts += [F(f"{prefix}id"), _sep(":"), F(f"{prefix}updated_at"), _sep("|")]
+    return _Concat(*parts)
+
+
+def _files_state(model, object_id):
+    """Count (so hard deletes count too) and last update of an object's files"""
+    files = FileUpload.objects.filter(
+        content_type_ref=ContentType.objects.get_for_model(model), object_id=object_id,
+    ).order_by().values("object_id")
+    return _Concat(
+        Subquery(files.annotate(count=Count("id")).values("count")), _sep(":"),
+        Subquery(files.annotate(last=Max("updated_at")).values("last")),
+    )
+
+
+def _state(queryset, *parts):
+    return Subquery(queryset.annotate(state=_Concat(*parts)).values("state")[:1])
+
+
+def _asset_state(object_id):
+    """Everything get_asset_serializer renders for the Equipment or Attachment with this id"""
+    equipment = _state(
+        Equipment.objects.filter(pk=object_id),
+        _rows_state(_EQUIPMENT_PATHS), _files_state(Equipment, OuterRef("pk")),
+    )
+    attachment = _state(
+        Attachment.objects.filter(pk=object_id),
+        _rows_state(_ATTACHMENT_PATHS), _files_state(Attachment, OuterRef("pk")),
+        _files_state(Equipment, OuterRef("equipment_id")),
+    )
+    return _Concat(equipment, _sep("|"), attachment)
+
+
+def _component_state(pk):
+    """
+    Everything a component detail renders, read in one indexed query: the component,
+    its asset, its work order (with the work order's own asset), its files and the
+    latest meter reading of its asset. None when the component does not exist.
+    """
+    work_order = _state(
+        WorkOrder.objects.filter(pk=OuterRef("work_order_id")),
+        _rows_state(_WORK_ORDER_PATHS), _asset_state(OuterRef("object_id")),
+    )
+    latest_reading = MeterReading.objects.filter(
+        content_type=OuterRef("content_type"), object_id=OuterRef("object_id"),
+    ).order_by("-created_at")
+    return Component.objects.filter(pk=pk).annotate(
+        asset_state=_asset_state(OuterRef("object_id")),
+        work_order_state=work_order,
+        files_state=_files_state(Component, OuterRef("pk")),
+        reading_updated=Subquery(latest_reading.values("updated_at")[:1]),
+    ).values_list(
+        "updated_at", "asset_state", "work_order_state", "files_state", "reading_updated",
+    ).first()
+
+
+def component_etag(request, pk=None, *args, **kwargs):
+    """
+    Weak validator for a component detail (see _component_state), daily as well since
+    warranty expiry is date based. Lists get no ETag: every row renders the same
+    related rows, which no cheap list-wide validator covers.
+    """
+    if not pk:
+        return None
+    try:
+        state = _component_state(pk)
+    except ValidationError:
+        return None  # not a UUID ("0" field listing, typos): let the view answer
+    if state is None:
+        return None
+    parts = [str(value) for value in state]
+    parts.append(str(timezone.now().date()))
+    return 'W/"%s"' % hashlib.md5("|".join(parts).encode()).hexdigest()
+
+
+@method_decorator(condition(etag_func=component_etag), name="get")
 class ComponentBaseView(BaseAPIView):
     serializer_class = ComponentBaseSerializer
     model_class = Component
-
-    
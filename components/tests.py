@@ -0,0 +1,78 @@
+import uuid
+
+from django.contrib.contenttypes.models import ContentType
+from django.test import TestCase
+
+from assets.models import Equipment
+from components.models import Component
+from components.platforms.base.views import component_etag
+from core.models import WorkOrderStatusControls
+from file_uploads.models import FileUpload
+from work_orders.models import WorkOrder, WorkOrderStatusNames
+
+
+class ComponentEtagTestCase(TestCase):
+    """component_etag must change whenever a row the detail response renders changes"""
+
+    def setUp(self):
+        self.component = Component.objects.create(
+            name='Test Component',
+            content_type=ContentType.objects.get_for_model(Equipment),
+            object_id=uuid.uuid4(),
+        )
+        self.files = [self.attach_file(f'file_{index}.txt') for index in range(2)]
+
+    def attach_file(self, filename):
+        return FileUpload.objects.create(
+            original_filename=filename,
+            file_size=1,
+            content_type='text/plain',
+            content_type_ref=ContentType.objects.get_for_model(Component),
+            object_id=self.component.pk,
+        )
+
+    def etag(self, component=None):
+        return component_etag(None, pk=str((component or self.component).pk))
+
+    def test_hard_delete_of_related_file_changes_etag(self):
+        """Deleting a file that does not hold the latest updated_at still changes the ETag"""
+        before = self.etag()
+        self.files[0].delete(hard_delete=True)
+        self.assertNotEqual(before, self.etag())
+
+    def test_new_related_file_changes_etag(self):
+        before = self.etag()
+        self.attach_file('file_new.txt')
+        self.assertNotEqual(before, self.etag())
+
+    def test_other_component_does_not_change_etag(self):
+        before = self.etag()
+        other = Component.objects.create(
+            name='Other Component',
+            content_type=ContentType.objects.get_for_model(Equipment),
+            object_id=uuid.uuid4(),
+        )
+        self.assertEqual(before, self.etag())
+        self.assertNotEqual(before, self.etag(other))
+
+    def test_nested_work_order_status_changes_etag(self):
+        """Rows rendered inside the work order (its status here) are part of the ETag"""
+        control = WorkOrderStatusControls.objects.create(key='active', name='Active', order=1)
+        status_name = WorkOrderStatusNames.objects.create(name='Active', control=control)
+        self.component.work_order = WorkOrder.objects.create(
+            content_type=ContentType.objects.get_for_model(Equipment),
+            object_id=self.component.object_id,
+            status=status_name,
+        )
+        self.component.save()
+        before = self.etag()
+        status_name.name = 'In Progress'
+        status_name.save()
+        self.assertNotEqual(before, self.etag())
+
+    def test_list_has_no_etag(self):
+        self.assertIsNone(component_etag(None))
+
+    def test_missing_component_has_no_etag(self):
+        self.assertIsNone(component_etag(None, pk=str(uuid.uuid4())))
+        self.assertIsNone(component_etag(None, pk='0'))
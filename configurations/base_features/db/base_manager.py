@@ -1,7 +1,10 @@
-import traceback
+import logging
 from django.db import models
+from django.utils import timezone
 from ..exceptions.base_exceptions import LocalBaseException
 
+logger = logging.getLogger(__name__)
+
 class BaseManager(models.Manager):
     """
     Shared manager for all Tenmil models.
@@ -18,7 +21,12 @@ class BaseManager(models.Manager):
     def model_field_type(self, field: str) -> str:
         return self.model._meta.get_field(field).get_internal_type()
 
-    def get_object_or_404(self, raise_exception=False, *args, **kwargs):
+    def get_object_or_404(self, raise_exception=False, *args, queryset=None, **kwargs):
+        """
+        `queryset` optionally narrows the lookup (e.g. select_related/only applied
+        by the caller); it defaults to this manager.
+        """
+        source = self if queryset is None else queryset
         data = None
         errors = []
         exception_type = None
@@ -39,14 +47,14 @@ class BaseManager(models.Manager):
                 else:
                     query_params[field] = value
 
-            data = self.get(*args, **query_params)
+            data = source.get(*args, **query_params)
 
         except self.model.MultipleObjectsReturned:
             exception_type = "multiple_objects_returned"
             status_code = 409
             errors = f"Multiple {self.model._meta.object_name} objects found."
             exception_kwargs = {
-                "count": self.filter(*args, **query_params).count(),
+                "count": source.filter(*args, **query_params).count(),
                 "model": self.model._meta.object_name
             }
 
@@ -57,7 +65,7 @@ class BaseManager(models.Manager):
             exception_kwargs = {"model": self.model._meta.object_name}
 
         except Exception as e:
-            traceback.print_exc()
+            logger.exception("get_object_or_404 failed", extra={"model": self.model.__name__})
             exception_type = "internal_error"
             status_code = 500
             errors = "Unexpected error"
@@ -102,6 +110,22 @@ class BaseManager(models.Manager):
             qs = qs.filter(is_deleted=False)
         return qs
 
+    def soft_delete(self, *args, **filters):
+        """
+        Soft-delete every matching row with a single UPDATE (requires `is_deleted` field).
+        Returns the number of rows affected.
+        """
+        if not self.model_field_exists("is_deleted"):
+            raise LocalBaseException(
+                exception=f"{self.model._meta.object_name} does not support soft delete.",
+                status_code=400,
+            )
+        now = timezone.now()
+        values = {"is_deleted": True, "updated_at": now}
+        if self.model_field_exists("deleted_at"):
+            values["deleted_at"] = now
+        return self.filter(*args, **filters).update(**values)
+
     def get_or_none(self, *args, **kwargs):
         """
         Returns an object or None if not found (safe fallback).
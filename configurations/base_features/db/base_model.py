@@ -1,14 +1,31 @@
+import os
+import time
 import uuid
 from django.db import models
 from .base_manager import BaseManager
 
+
+def uuid7() -> uuid.UUID:
+    """
+    Time-ordered UUID (RFC 9562 version 7): 48-bit unix ms timestamp followed by random bits,
+    so new primary keys land on the right-most B-tree leaf instead of random pages.
+    """
+    if hasattr(uuid, "uuid7"):  # python 3.14+
+        return uuid.uuid7()
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
 class BaseModel(models.Model):
     """
     Abstract base model with UUID primary key, timestamps, and custom manager.
     """
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
         unique=True
     )
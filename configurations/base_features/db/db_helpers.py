@@ -1,7 +1,7 @@
 from django.contrib.contenttypes.models import ContentType
 from assets.models import *
 from typing import Union, Type
-from django.db.models import Model
+from django.db.models import IntegerField, Model, Value
 from django.db.models.manager import BaseManager
 
 from configurations.base_features.exceptions.base_exceptions import LocalBaseException
@@ -12,7 +12,8 @@ def get_object_by_content_type_and_id(content_type_id: int, object_id: str) -> M
     Raises LocalBaseException if invalid or not found.
     """
     try:
-        content_type = ContentType.objects.get(pk=content_type_id)
+        # get_for_id reads from ContentType's per-process cache
+        content_type = ContentType.objects.get_for_id(content_type_id)
     except ContentType.DoesNotExist:
         raise LocalBaseException("Invalid content type.", status_code=400)
 
@@ -47,14 +48,28 @@ def get_content_type_and_object_id(
             return ct , str(obj_or_id.pk)
         return ct.pk, str(obj_or_id.pk)
 
-    for model in candidate_models:
-        instance = model.objects.filter(pk=obj_or_id).first()
-        if instance:
-            ct = ContentType.objects.get_for_model(model)
-            res_ct = ct if return_ct_instance else ct.pk
-            res_obj_id = instance if return_instance else instance.pk
-            return res_ct, res_obj_id
-    raise LocalBaseException(exception="Invalid ID or related model")
+    if not candidate_models:
+        raise LocalBaseException(exception="Invalid ID or related model")
+
+    # Probe every candidate in one UNION ALL round trip, tagging rows with their content type id
+    content_types = ContentType.objects.get_for_models(*candidate_models)
+    probes = [
+        model.objects.filter(pk=obj_or_id)
+        .order_by()
+        .annotate(ct_id=Value(content_types[model].pk, output_field=IntegerField()))
+        .values_list("ct_id", flat=True)
+        for model in candidate_models
+    ]
+    query = probes[0].union(*probes[1:], all=True) if len(probes) > 1 else probes[0]
+    match = list(query[:1])
+    if not match:
+        raise LocalBaseException(exception="Invalid ID or related model")
+
+    ct = ContentType.objects.get_for_id(match[0])
+    res_ct = ct if return_ct_instance else ct.pk
+    if return_instance:
+        return res_ct, ct.model_class().objects.get(pk=obj_or_id)
+    return res_ct, obj_or_id
 
 def get_objects_by_gfk(model_class: Model, id: str, related_models: list, *q_params, **params):
     """
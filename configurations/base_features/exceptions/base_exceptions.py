@@ -1,10 +1,24 @@
 import logging
+from functools import lru_cache
 from django.conf import settings
 from rest_framework.response import Response
 from ..error_translation import ERRORS, DEFAULT_ERROR_LANGUAGE
 
 logger = logging.getLogger("django")
 
+ERROR_TYPES = frozenset(ERRORS)
+
+
+@lru_cache(maxsize=256)
+def get_error_template(exception_type: str, lang: str) -> str:
+    """
+    Return the translated message template for an error type,
+    falling back to DEFAULT_ERROR_LANGUAGE when `lang` is missing.
+    """
+    error = ERRORS[exception_type]
+    return error.get(lang) or error[DEFAULT_ERROR_LANGUAGE]
+
+
 class LocalBaseException(Exception):
     """
     A base exception for the Tenmil platform.
@@ -30,14 +44,12 @@ class LocalBaseException(Exception):
             self.message = "Either exception_type or exception must be provided."
         elif exception:
             self.message = exception
-        elif exception_type not in ERRORS:
+        elif exception_type not in ERROR_TYPES:
             self.message = "Unknown exception type."
         else:
-            error = ERRORS[exception_type]
-            if lang not in error:
-                lang = DEFAULT_ERROR_LANGUAGE
+            template = get_error_template(exception_type, lang)
             try:
-                self.message = error[lang].format(**self.kwargs)
+                self.message = template.format(**self.kwargs)
             except Exception as e:
                 self.message = f"Error formatting message: {str(e)}"
 
@@ -0,0 +1,40 @@
+import atexit
+import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+
+class BackgroundStreamHandler(QueueHandler):
+    """
+    Logging handler that formats records in the calling thread (QueueHandler.prepare,
+    which also drops args and exc_info) and only enqueues them; a listener thread
+    writes them to stderr, so request threads never block on the stream.
+
+    The listener is started lazily per process: with gunicorn's preload_app the
+    settings are loaded in the master and threads do not survive the fork.
+    """
+
+    def __init__(self):
+        super().__init__(queue.SimpleQueue())
+        self._pid = None
+        self._listener = None
+        self._start_lock = threading.Lock()
+
+    def _start_listener(self):
+        with self._start_lock:
+            # another thread of this (gthread) worker may have started it meanwhile
+            if self._pid == os.getpid():
+                return
+            self.queue = queue.SimpleQueue()
+            # records arrive already formatted, the stream only writes the message
+            self._listener = QueueListener(self.queue, logging.StreamHandler())
+            self._listener.start()
+            atexit.register(self._listener.stop)
+            self._pid = os.getpid()
+
+    def emit(self, record):
+        if self._pid != os.getpid():
+            self._start_listener()
+        super().emit(record)
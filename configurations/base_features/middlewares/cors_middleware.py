@@ -0,0 +1,34 @@
+"""
+CORS Middleware
+
+django-cors-headers' CorsMiddleware with the allowed-origins check reduced to a
+set lookup. The stock middleware re-parses every CORS_ALLOWED_ORIGINS entry with
+urlsplit() on each request and compares them one by one.
+"""
+
+from typing import FrozenSet, Sequence, Tuple
+from urllib.parse import SplitResult, urlsplit
+
+from corsheaders.conf import conf
+from corsheaders.middleware import CorsMiddleware
+
+
+class CachedCorsMiddleware(CorsMiddleware):
+    """
+    CorsMiddleware matching the origin's (scheme, netloc) against a frozenset
+    built once from CORS_ALLOWED_ORIGINS (rebuilt only if the setting object changes).
+    """
+    
+    _origins_source: Sequence[str] = None
+    _origins: FrozenSet[Tuple[str, str]] = frozenset()
+    
+    def _allowed_origins(self) -> FrozenSet[Tuple[str, str]]:
+        """(scheme, netloc) pairs of the allowed origins, parsed once per settings value."""
+        source = conf.CORS_ALLOWED_ORIGINS
+        if source is not self._origins_source:
+            self._origins = frozenset((origin.scheme, origin.netloc) for origin in map(urlsplit, source))
+            self._origins_source = source
+        return self._origins
+    
+    def _url_in_whitelist(self, url: SplitResult) -> bool:
+        return (url.scheme, url.netloc) in self._allowed_origins()
@@ -14,17 +14,169 @@ Best Practices:
 """
 
 import logging
-from typing import Optional, Dict, Any
+import re
+import time
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Iterable, Mapping, Tuple
 from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
 from django.http import HttpRequest, HttpResponse
-from django.utils.deprecation import MiddlewareMixin
-from django_tenants.utils import get_tenant
-from core.models import Tenant
+from django_tenants.middleware.main import TenantMainMiddleware
+from django_tenants.utils import remove_www
+from core.models import Domain, Tenant
 
 logger = logging.getLogger(__name__)
 
+_INVALID_TENANT_BODY = b"Invalid tenant subdomain."
+_SERVER_ERROR_BODY = b"Internal server error."
 
-class SubdomainTenantMiddleware(MiddlewareMixin):
+# Shared, read-only feature flags for every admin-domain request
+_ADMIN_FEATURES = MappingProxyType({
+    "is_admin": True,
+    "enable_reports": True,
+    "max_users": 1000,  # Higher limits for admin
+})
+
+
+def get_request_host(request: HttpRequest) -> str:
+    """
+    Return the request host without port, computed once per request.
+    
+    get_host() re-validates ALLOWED_HOSTS on every call, so the parsed
+    value is stored on the request for the rest of the middleware chain.
+    """
+    host = getattr(request, "_host", None)
+    if host is None:
+        host = request._host = request.get_host().partition(":")[0]
+    return host
+
+
+# Per-process front for get_cached_tenant: hostname -> (expires_at, tenant).
+# Saves the shared-cache round trip on every request; entries live for
+# TENANT_LOCAL_CACHE_TTL seconds, so other workers see tenant edits that late.
+_local_tenants: Dict[str, Tuple[float, Tenant]] = {}
+_LOCAL_TENANTS_MAX = 1024
+
+
+def forget_local_tenants(hostnames: Iterable[str]) -> None:
+    """Drop `hostnames` from this process' tenant memo."""
+    for hostname in hostnames:
+        _local_tenants.pop(hostname, None)
+
+
+def tenant_cache_key(hostname: str) -> str:
+    """Cache key holding the tenant resolved for `hostname`."""
+    return f"tenant:{hostname}"
+
+
+def tenant_miss_cache_key(hostname: str) -> str:
+    """Cache key flagging `hostname` as having no tenant."""
+    return f"tenant:miss:{hostname}"
+
+
+def build_tenant_features(tenant: Tenant) -> Dict[str, Any]:
+    """
+    Build the feature flags exposed on request.tenant_features.
+    
+    Args:
+        tenant: Tenant object
+        
+    Returns:
+        Dictionary of tenant features
+    """
+    # This can be extended to fetch from database or cache
+    return {
+        "enable_reports": True,
+        "max_users": 10,
+        "tenant_id": str(tenant.id),
+        "tenant_name": tenant.name,
+        "on_trial": tenant.on_trial,
+        "paid_until": str(tenant.paid_until) if tenant.paid_until else None,
+    }
+
+
+def _fetch_tenant(hostname: str) -> Tenant:
+    """
+    Load the tenant owning `hostname` with only the fields requests read.
+    
+    The feature flags are built here too, so they are cached with the tenant
+    instead of being rebuilt on every request.
+    """
+    tenant = (
+        Domain.objects.select_related("tenant")
+        .only(
+            "tenant",
+            "tenant__id",
+            "tenant__schema_name",
+            "tenant__name",
+            "tenant__on_trial",
+            "tenant__paid_until",
+        )
+        .get(domain=hostname)
+        .tenant
+    )
+    tenant._features = build_tenant_features(tenant)
+    return tenant
+
+
+def get_cached_tenant(hostname: str) -> Tenant:
+    """
+    Resolve the tenant owning `hostname` through the Django cache,
+    so all workers share one DB lookup per TENANT_CACHE_TTL.
+    
+    Unknown hosts are negative-cached for TENANT_MISS_CACHE_TTL so scanner
+    traffic on random subdomains cannot turn into one query per request.
+    
+    A short-lived per-process memo sits in front of the shared cache.
+    Entries are dropped by the Tenant/Domain save/delete signals in core.signals.
+    
+    Args:
+        hostname: Host without port (e.g., 'tenant.api.alfrih.com')
+        
+    Returns:
+        Tenant object
+        
+    Raises:
+        Domain.DoesNotExist: if no domain matches
+    """
+    now = time.monotonic()
+    entry = _local_tenants.get(hostname)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+    miss_key = tenant_miss_cache_key(hostname)
+    if cache.get(miss_key):
+        raise Domain.DoesNotExist(f"No domain for host '{hostname}' (cached)")
+    try:
+        tenant = cache.get_or_set(
+            tenant_cache_key(hostname),
+            lambda: _fetch_tenant(hostname),
+            timeout=settings.TENANT_CACHE_TTL,
+        )
+    except Domain.DoesNotExist:
+        cache.set(miss_key, True, timeout=settings.TENANT_MISS_CACHE_TTL)
+        raise
+    if len(_local_tenants) >= _LOCAL_TENANTS_MAX:
+        _local_tenants.clear()
+    _local_tenants[hostname] = (now + settings.TENANT_LOCAL_CACHE_TTL, tenant)
+    return tenant
+
+
+class CachedTenantMainMiddleware(TenantMainMiddleware):
+    """
+    django-tenants' TenantMainMiddleware with the per-request
+    Domain -> Tenant query served from the Django cache.
+    """
+    
+    @staticmethod
+    def hostname_from_request(request):
+        return remove_www(get_request_host(request))
+    
+    def get_tenant(self, domain_model, hostname):
+        return get_cached_tenant(hostname)
+
+
+class SubdomainTenantMiddleware:
     """
     Middleware that validates tenant access and sets custom request attributes.
     
@@ -43,18 +195,38 @@ class SubdomainTenantMiddleware(MiddlewareMixin):
     - request.tenant: The validated tenant object
     - request.schema_name: The tenant's schema name
     - request.is_admin_subdomain: Boolean indicating admin domain
-    - request.tenant_features: Dict of tenant-specific features/flags
+    - request.tenant_features: Read-only mapping of tenant-specific features/flags
     """
     
-    def __init__(self, get_response=None):
-        """Initialize middleware with optional get_response function."""
-        super().__init__(get_response)
+    __slots__ = ("get_response", "_base_domain", "_admin_hosts", "_host_re", "_add_debug_headers")
+    
+    def __init__(self, get_response):
+        """Initialize middleware with the next handler in the chain."""
+        self.get_response = get_response
         self._validate_settings()
+        # Debug headers are decided once; production responses skip process_response entirely
+        self._add_debug_headers = bool(settings.DEBUG)
+    
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """Resolve tenant attributes, call the rest of the chain, post-process the response."""
+        response = self.process_request(request) or self.get_response(request)
+        if self._add_debug_headers:
+            response = self.process_response(request, response)
+        return response
     
     def _validate_settings(self) -> None:
-        """Validate required settings are configured."""
+        """Validate required settings are configured and snapshot them."""
         if not hasattr(settings, 'BASE_DOMAIN'):
             raise ValueError("BASE_DOMAIN setting is required for SubdomainTenantMiddleware")
+        # Read once here instead of through the LazySettings proxy on every request
+        self._base_domain = settings.BASE_DOMAIN
+        # Hosts served from the public schema: BASE_DOMAIN plus any extra PUBLIC_DOMAINS
+        self._admin_hosts = frozenset((self._base_domain, *getattr(settings, 'PUBLIC_DOMAINS', ())))
+        # Classifies admin vs tenant host and captures the subdomain in a single match
+        self._host_re = re.compile(
+            rf"^(?:(?P<subdomain>[a-z0-9-]+)\.)?{re.escape(self._base_domain)}$",
+            re.IGNORECASE,
+        )
     
     def _extract_subdomain(self, host: str) -> str:
         """
@@ -66,22 +238,28 @@ class SubdomainTenantMiddleware(MiddlewareMixin):
         Returns:
             Subdomain string (e.g., 'tenant')
         """
-        return host.split('.')[0]
+        return host.partition('.')[0]
     
-    def _is_admin_subdomain(self, host: str) -> bool:
+    def _parse_host(self, host: str) -> Tuple[bool, Optional[str]]:
         """
-        Determine if the host is an admin subdomain.
+        Classify the host and extract its subdomain.
         
         Args:
             host: Full host string
             
         Returns:
-            True if admin subdomain, False otherwise
+            (is_admin, subdomain) - only the exact admin hosts are admin (subdomain None);
+            hosts outside BASE_DOMAIN (e.g. local development) fall back to their first label
         """
-        # Only the exact BASE_DOMAIN is admin, not subdomains of it
-        return host == settings.BASE_DOMAIN
+        if host in self._admin_hosts:
+            return True, None
+        match = self._host_re.match(host)
+        if match is None:
+            return False, self._extract_subdomain(host)
+        subdomain = match.group("subdomain")
+        return subdomain is None, subdomain
     
-    def _get_tenant_features(self, tenant: Tenant) -> Dict[str, Any]:
+    def _get_tenant_features(self, tenant: Tenant) -> Mapping[str, Any]:
         """
         Get tenant-specific features and flags.
         
@@ -89,17 +267,13 @@ class SubdomainTenantMiddleware(MiddlewareMixin):
             tenant: Tenant object
             
         Returns:
-            Dictionary of tenant features
+            Read-only mapping of tenant features
         """
-        # This can be extended to fetch from database or cache
-        return {
-            "enable_reports": True,
-            "max_users": 10,
-            "tenant_id": str(tenant.id),
-            "tenant_name": tenant.name,
-            "on_trial": tenant.on_trial,
-            "paid_until": str(tenant.paid_until) if tenant.paid_until else None,
-        }
+        features = getattr(tenant, "_features", None)
+        if features is None:
+            # Tenant did not come through get_cached_tenant
+            features = tenant._features = build_tenant_features(tenant)
+        return MappingProxyType(features)
     
     def _handle_admin_subdomain(self, request: HttpRequest, host: str) -> None:
         """
@@ -112,13 +286,9 @@ class SubdomainTenantMiddleware(MiddlewareMixin):
         setattr(request, 'is_admin_subdomain', True)
         setattr(request, 'tenant', None)
         setattr(request, 'schema_name', "public")
-        setattr(request, 'tenant_features', {
-            "is_admin": True,
-            "enable_reports": True,
-            "max_users": 1000,  # Higher limits for admin
-        })
+        setattr(request, 'tenant_features', _ADMIN_FEATURES)
         
-        logger.debug(f"Admin subdomain detected: {host}")
+        logger.debug("Admin subdomain detected: %s", host)
     
     def _validate_tenant_subdomain(self, request: HttpRequest, host: str, subdomain: str) -> Optional[HttpResponse]:
         """
@@ -133,29 +303,20 @@ class SubdomainTenantMiddleware(MiddlewareMixin):
             HttpResponse if validation fails, None if successful
         """
         try:
-            # Get tenant that django-tenants has already set
-            tenant = get_tenant(request)
+            # Get tenant that django-tenants has already set on the connection
+            tenant = getattr(connection, "tenant", None)
             
             # Check if tenant exists
             if tenant is None:
-                logger.warning(f"No tenant found for subdomain: '{subdomain}' from host '{host}'")
+                logger.warning("No tenant found for subdomain: '%s' from host '%s'", subdomain, host)
                 return HttpResponse(
-                    b"Invalid tenant subdomain.", 
+                    _INVALID_TENANT_BODY,
                     status=404,
                     content_type="text/plain"
                 )
             
-            # Validate tenant matches expected subdomain
-            if tenant.schema_name != subdomain:
-                logger.warning(
-                    f"Tenant mismatch: expected '{subdomain}', got '{tenant.schema_name}' "
-                    f"from host '{host}'"
-                )
-                return HttpResponse(
-                    b"Invalid tenant subdomain.", 
-                    status=404,
-                    content_type="text/plain"
-                )
+            # No schema_name == subdomain check: the tenant was resolved from the
+            # unique Domain row for this exact host, which is authoritative
             
             # Set request attributes
             setattr(request, 'tenant', tenant)
@@ -163,13 +324,13 @@ class SubdomainTenantMiddleware(MiddlewareMixin):
             setattr(request, 'is_admin_subdomain', False)
             setattr(request, 'tenant_features', self._get_tenant_features(tenant))
             
-            logger.debug(f"Tenant validated: {tenant.schema_name} for host: {host}")
+            logger.debug("Tenant validated: %s for host: %s", tenant.schema_name, host)
             return None
             
         except Exception as e:
-            logger.exception(f"Tenant validation error for host '{host}': {str(e)}")
+            logger.exception("Tenant validation error for host '%s': %s", host, e)
             return HttpResponse(
-                b"Internal server error.", 
+                _SERVER_ERROR_BODY,
                 status=500,
                 content_type="text/plain"
             )
@@ -185,13 +346,14 @@ class SubdomainTenantMiddleware(MiddlewareMixin):
             HttpResponse if request should be terminated, None to continue
         """
         # Extract host and subdomain
-        host = request.get_host().split(":")[0]
-        subdomain = self._extract_subdomain(host)
+        host = get_request_host(request)
+        is_admin, subdomain = self._parse_host(host)
+        request._subdomain = subdomain
         
-        logger.debug(f"Processing request for host: {host}, subdomain: {subdomain}")
+        logger.debug("Processing request for host: %s, subdomain: %s", host, subdomain)
         
         # Handle admin subdomain
-        if self._is_admin_subdomain(host):
+        if is_admin:
             self._handle_admin_subdomain(request, host)
             return None
         
@@ -200,7 +362,7 @@ class SubdomainTenantMiddleware(MiddlewareMixin):
     
     def process_response(self, request: HttpRequest, response: HttpResponse) -> HttpResponse:
         """
-        Process the response (optional post-processing).
+        Process the response (only called in DEBUG mode).
         
         Args:
             request: Django request object
@@ -209,13 +371,12 @@ class SubdomainTenantMiddleware(MiddlewareMixin):
         Returns:
             Modified response object
         """
-        # Add tenant info to response headers for debugging (only in DEBUG mode)
-        if settings.DEBUG:
-            tenant_info = getattr(request, 'tenant', None)
-            if tenant_info:
-                response['X-Tenant'] = tenant_info.schema_name
-                response['X-Tenant-ID'] = str(tenant_info.id)
-            else:
-                response['X-Tenant'] = 'public'
+        # Add tenant info to response headers for debugging
+        tenant_info = getattr(request, 'tenant', None)
+        if tenant_info:
+            response['X-Tenant'] = tenant_info.schema_name
+            response['X-Tenant-ID'] = str(tenant_info.id)
+        else:
+            response['X-Tenant'] = 'public'
         
         return response
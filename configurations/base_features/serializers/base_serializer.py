@@ -18,6 +18,26 @@ class BaseSerializer(ModelSerializer):
         fields = "__all__"
         read_only_fields = ("id", "created_at", "updated_at")  # can be overridden
 
+    # Resolved once per class in __init_subclass__, not per serialized row
+    _internal_fields = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        strip_internal = getattr(cls.Meta, "strip_internal_fields", False)
+        cls._internal_fields = ("is_deleted",) if strip_internal else ()
+
+        # Subclasses that keep the default mod_create/mod_update skip the
+        # dispatch hop and call ModelSerializer directly.
+        for method, hook in (("create", "mod_create"), ("update", "mod_update")):
+            if method in cls.__dict__:
+                continue
+            if getattr(cls, method) not in (getattr(BaseSerializer, method), getattr(ModelSerializer, method)):
+                continue
+            if getattr(cls, hook) is getattr(BaseSerializer, hook):
+                setattr(cls, method, getattr(ModelSerializer, method))
+            else:
+                setattr(cls, method, getattr(BaseSerializer, method))
+
     # -------------------------------
     # Internal: do not override these
     # -------------------------------
@@ -33,11 +53,9 @@ class BaseSerializer(ModelSerializer):
     def to_representation(self, instance) -> OrderedDict:
         representation = self.mod_to_representation(instance)
 
-        # Optional: auto-strip internal fields if desired
-        if hasattr(self.Meta, "strip_internal_fields") and self.Meta.strip_internal_fields:
-            internal_fields = ["is_deleted"]
-            for f in internal_fields:
-                representation.pop(f, None)
+        # Optional: auto-strip internal fields if desired (Meta.strip_internal_fields)
+        for f in self._internal_fields:
+            representation.pop(f, None)
 
         return representation
 
@@ -58,6 +76,20 @@ class BaseSerializer(ModelSerializer):
     # Helpers
     # -------------------------------
 
+    @classmethod
+    def represent(cls, instance):
+        """
+        Serialize a single nested object through one shared, context-free serializer
+        per class, instead of building a new serializer (and its fields) per row.
+        Use it in mod_to_representation in place of `SomeSerializer(obj).data`.
+        """
+        if instance is None:
+            return cls(instance).data
+        serializer = cls.__dict__.get("_shared_serializer")
+        if serializer is None:
+            serializer = cls._shared_serializer = cls()
+        return serializer.to_representation(instance)
+
     def get_request(self):
         return self.context.get("request")
 
@@ -7,24 +7,23 @@ from configurations.base_features.constants import User
 from configurations.base_features.error_translation import ERRORS
 from configurations.base_features.exceptions.base_exceptions import LocalBaseException
 
+NOT_AUTHENTICATED_ERROR = ERRORS['not_authenticated']['en']
+
 
 class AuthMixin(BaseAuthentication):
-    
+    # stateless, so one instance is shared instead of re-reading simplejwt settings per request
+    _jwt = JWTAuthentication()
 
     def authenticate(self, request):
-        user_lang = 'en'
-        not_authenticated_error = ERRORS['not_authenticated'][user_lang]
-        not_found_error = ERRORS['not_found'][user_lang]
-        try:            
-            authenticator = JWTAuthentication()
-            authentication  = authenticator.authenticate(request)
+        try:
+            authentication = self._jwt.authenticate(request)
             if not authentication:
-                raise LocalBaseException(not_authenticated_error, 401)
+                raise LocalBaseException(NOT_AUTHENTICATED_ERROR, 401)
             user, token = authentication
             return user, token
         except (ValueError, KeyError, User.DoesNotExist) as e:
             traceback.print_exc()
-            raise LocalBaseException(not_authenticated_error, 401)
+            raise LocalBaseException(NOT_AUTHENTICATED_ERROR, 401)
 
     def get_user(self, request):
         # This is called by DRF to get the user from the request
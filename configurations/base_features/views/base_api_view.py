@@ -1,16 +1,194 @@
+import copy
+from functools import lru_cache
+from itertools import islice
 from rest_framework.views import APIView
 from assets.models import Attachment, Equipment
 from assets.services import get_assets_by_gfk, get_content_type_and_asset_id
-from configurations import settings
 from configurations.base_features.exceptions.base_exceptions import LocalBaseException
 from configurations.base_features.helpers.text_helpers import snake_to_title
+from configurations.base_features.serializers.base_serializer import BaseSerializer
 from configurations.base_features.views.base_exception_handler import BaseExceptionHandlerMixin
 from configurations.base_features.views.base_response import ResponseFormatterMixin
 from tenant_users.auth_backend import TenantUserAuthBackend
 from tenant_users.auth_jwt import TenantJWTAuthentication
 from tenant_users.permissions import IsTenantAuthenticated
 from django.contrib.contenttypes.fields import GenericForeignKey
+from django.core.exceptions import FieldDoesNotExist
 from django.db.models import ForeignKey, ManyToManyField, QuerySet
+from rest_framework.serializers import (
+    BaseSerializer as DRFBaseSerializer, FileField, HiddenField, ListSerializer, ManyRelatedField,
+    PrimaryKeyRelatedField, RelatedField, SerializerMethodField,
+)
+
+
+# Column order for get_field_properities: id, other/relation fields, date/bool/text fields, description
+_FIELD_RANK = {'id': 0, 'description': 3}
+_LATE_TYPES = frozenset({'DateTimeField', 'DateField', 'TextField', 'BooleanField'})
+
+
+def _rank(field):
+    return _FIELD_RANK.get(field['slug'], 2 if field['type'] in _LATE_TYPES else 1)
+
+
+@lru_cache(maxsize=None)
+def _field_index(model_class):
+    """
+    Per-model field lookups, built once instead of walking _meta on every request.
+
+    Returns (field_map, gfk_names, fk_names, m2m_names, internal_types, exact_names):
+        field_map       name -> field, as returned by _meta.get_fields()
+        gfk_names       names of GenericForeignKey fields
+        fk_names        names of ForeignKey (and OneToOne) fields
+        m2m_names       names of ManyToManyField fields
+        internal_types  name -> get_internal_type()
+        exact_names     relation fields filtered by value, never wrapped in `__icontains`
+    """
+    field_map = {f.name: f for f in model_class._meta.get_fields()}
+    gfk_names = frozenset(
+        f.name for f in model_class._meta.private_fields
+        if isinstance(f, GenericForeignKey)
+    )
+    fk_names = frozenset(name for name, f in field_map.items() if isinstance(f, ForeignKey))
+    m2m_names = frozenset(name for name, f in field_map.items() if isinstance(f, ManyToManyField))
+    internal_types = {name: f.get_internal_type() for name, f in field_map.items()}
+    exact_names = gfk_names | fk_names | m2m_names
+    return field_map, gfk_names, fk_names, m2m_names, internal_types, exact_names
+
+
+@lru_cache(maxsize=1024)
+def _field_properties(model_class, keys=None):
+    """
+    Field descriptors for get_field_properities, cached per model and key tuple
+    (None means all model fields). The dicts are shared, treat them as read-only.
+    """
+    # one list per rank; fields keep their declaration order inside each bucket
+    buckets = ([], [], [], [])
+    internal_types = _field_index(model_class)[4]
+    for field in keys if keys is not None else internal_types:
+        slug = field
+        type_ = internal_types.get(field, "ForeignKey")
+        name = snake_to_title(field)
+        descriptor = {"slug": slug, "name": name, "type": type_}
+        buckets[_rank(descriptor)].append(descriptor)
+    return (*buckets[0], *buckets[1], *buckets[2], *buckets[3])
+
+
+# serializer fields that need the model instance (or the request) to render
+_NOT_FLAT_FIELDS = (DRFBaseSerializer, ManyRelatedField, SerializerMethodField, HiddenField, FileField)
+
+
+@lru_cache(maxsize=None)
+def _flat_fields(serializer_class):
+    """
+    For serializers that only render plain model columns, return ((name, field), ...)
+    so lists can be read with .values() instead of building model instances.
+
+    Returns None when the serializer customises its representation, or when any
+    field needs more than its own column (nested, method, file, M2M, dotted source...).
+    """
+    if not (isinstance(serializer_class, type) and issubclass(serializer_class, BaseSerializer)):
+        return None
+    if (serializer_class.to_representation is not BaseSerializer.to_representation
+            or serializer_class.mod_to_representation is not BaseSerializer.mod_to_representation):
+        return None
+    try:
+        model = serializer_class.Meta.model
+        fields = []
+        for name, field in serializer_class().fields.items():
+            if field.write_only or name in serializer_class._internal_fields:
+                continue
+            if isinstance(field, _NOT_FLAT_FIELDS) or field.source != name:
+                return None
+            if isinstance(field, RelatedField) and not (
+                    isinstance(field, PrimaryKeyRelatedField) and field.pk_field is None):
+                return None
+            model_field = model._meta.get_field(name)
+            if not model_field.concrete or model_field.many_to_many:
+                return None
+            fields.append((name, field))
+    except (FieldDoesNotExist, AttributeError):
+        # serializer field without a model column of the same name (or no Meta.model)
+        return None
+    return tuple(fields)
+
+
+def _auto_related(serializer_class, model_class, max_depth=3):
+    """
+    Work out which relations a serializer reads, so querysets can load them up front.
+
+    Walks the serializer's fields (and nested serializers) resolving each `source`
+    through the model meta:
+        ForeignKey / OneToOne            -> select_related
+        reverse / ManyToMany / GFK       -> prefetch_related
+    Plain PrimaryKeyRelatedField-style fields only read `<fk>_id` and are skipped.
+
+    Returns (fk_paths, m2m_paths) as tuples of lookup strings.
+    """
+    fk_paths, m2m_paths = set(), set()
+
+    def walk(serializer, model, prefix, prefetching, depth):
+        if depth > max_depth:
+            return
+        for field in serializer.fields.values():
+            if field.write_only or field.source == "*":
+                continue
+            is_nested = isinstance(field, DRFBaseSerializer)
+            attrs = field.source_attrs
+            if isinstance(field, ListSerializer):
+                field = field.child
+            elif isinstance(field, ManyRelatedField):
+                field = field.child_relation
+            pk_only = isinstance(field, RelatedField) and field.use_pk_only_optimization()
+            current_model, path, in_prefetch = model, prefix, prefetching
+            for index, attr in enumerate(attrs):
+                try:
+                    model_field = current_model._meta.get_field(attr)
+                except FieldDoesNotExist:
+                    break
+                if not model_field.is_relation:
+                    break
+                path = f"{path}__{attr}" if path else attr
+                is_last = index == len(attrs) - 1
+                if model_field.many_to_one or model_field.one_to_one:
+                    if model_field.related_model is None:
+                        # GenericForeignKey: target model varies per row
+                        m2m_paths.add(path)
+                        break
+                    if is_last and pk_only:
+                        break
+                    (m2m_paths if in_prefetch else fk_paths).add(path)
+                else:
+                    m2m_paths.add(path)
+                    in_prefetch = True
+                current_model = model_field.related_model
+                if is_last and is_nested:
+                    walk(field, current_model, path, in_prefetch, depth + 1)
+
+    try:
+        walk(serializer_class(), model_class, "", False, 1)
+    except Exception:
+        # Serializers that need request context to build their fields are left as-is
+        return (), ()
+    # A path that is prefetched already covers the select_related one below it
+    fk_paths = {path for path in fk_paths if not any(path.startswith(f"{m}__") for m in m2m_paths)}
+    return tuple(sorted(fk_paths)), tuple(sorted(m2m_paths))
+
+def warm_view_caches():
+    """
+    Fill the per-model/per-view metadata caches for every BaseAPIView subclass.
+    Called from gunicorn's when_ready so forked workers inherit them.
+    """
+    from django.urls import get_resolver
+    get_resolver().url_patterns  # import every view module
+    pending = list(BaseAPIView.__subclasses__())
+    while pending:
+        view_class = pending.pop()
+        pending.extend(view_class.__subclasses__())
+        if view_class.model_class is None:
+            continue
+        _field_properties(view_class.model_class)
+        view_class().get_related_paths()
+
 
 class BaseAPIView(TenantUserAuthBackend, BaseExceptionHandlerMixin, APIView, ResponseFormatterMixin):
     """
@@ -41,6 +219,24 @@ class BaseAPIView(TenantUserAuthBackend, BaseExceptionHandlerMixin, APIView, Res
     authentication_classes = [TenantJWTAuthentication]
     # ['*'] to allow all roles or specify roles like ['admin', 'support'] from STANDARD_GROUPS
     allowed_roles = ['*']  # "super-admin" and "admin" are always allowed
+    # allowed_roles with "super-admin"/"admin" added, resolved once per class in __init_subclass__
+    _allowed_roles = frozenset(["super-admin", "admin", "*"])
+    # (serializer_class, model_class) -> (select_related paths, prefetch_related paths)
+    _related_paths = {}
+    # set to a tuple of field names to load only those columns (plus the select_related relations)
+    only_fields = None
+    # stream list() responses in batches instead of building the whole payload in memory
+    stream_list = False
+    stream_chunk_size = 2000
+    stream_batch_size = 500
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # add "super-admin" and "admin" to allowed roles
+        if "super-admin" not in cls.allowed_roles:
+            cls._allowed_roles = frozenset(["super-admin", "admin", *cls.allowed_roles])
+        else:
+            cls._allowed_roles = frozenset(cls.allowed_roles)
 
     def get_request_user(self, request):
         """Get the request user, if not authenticated raise BaseException"""
@@ -50,74 +246,48 @@ class BaseAPIView(TenantUserAuthBackend, BaseExceptionHandlerMixin, APIView, Res
         return user
 
     def get_user_role(self, user):
-        """Get the user role"""
-        user_roles = [role.name for role in user.groups.all()]
+        """Get the user role names, queried once and kept on the user for the rest of the request"""
+        user_roles = getattr(user, "_role_names", None)
+        if user_roles is None:
+            user_roles = user._role_names = frozenset(user.groups.values_list("name", flat=True))
         return user_roles
 
     def authorize_user(self, request):
         return self.authenticate(request)
         # """Authorize the user based on the allowed roles"""
-        # # add "super-admin" and "admin" to allowed roles
-        # if "super-admin" not in self.allowed_roles:
-        #     allowed_roles = ["super-admin", "admin", *self.allowed_roles]
-        # else:
-        #     allowed_roles = self.allowed_roles
-
         # user = self.get_request_user(request)
         # user_role = self.get_user_role(user)
-        # if "*" not in allowed_roles and not set(user_role) & set(allowed_roles):
+        # if "*" not in self._allowed_roles and not user_role & self._allowed_roles:
         #     raise LocalBaseException(exception_type="not_authorized", status_code=401)
         # return user, user_role
 
 
     def get_field_properities(self, data=None):
         """Get the field properties"""
-        fields = []
-        model_fields = [
-            field.name for field in self.model_class._meta.get_fields()]
-        keys = data.keys() if data else model_fields
-        for field in keys:
-            slug = field
-            type_ = self.model_class._meta.get_field(
-                field).get_internal_type() if field in model_fields else "ForeignKey"
-            name = snake_to_title(field)
-            fields.append({"slug": slug, "name": name, "type": type_})
-        sorted_fields = fields.copy()
-        for field in fields:
-            if field['slug'] == 'id':
-                sorted_fields.remove(field)
-                sorted_fields.insert(0, field)
-            elif field['slug'] == 'description':
-                sorted_fields.remove(field)
-                sorted_fields.insert(-1, field)
-            elif field['type'] in ['DateTimeField', 'DateField', 'TextField', 'BooleanField']:
-                sorted_fields.remove(field)
-                if sorted_fields[-1]['slug'] == 'description':
-                    sorted_fields.insert(-2, field)
-                elif sorted_fields[-2]['slug'] == 'description':
-                    sorted_fields.insert(-3, field)
-                else:
-                    sorted_fields.insert(-1, field)
-            else:
-                sorted_fields.remove(field)
-                sorted_fields.insert(1, field)
-
-        return sorted_fields
-    
-    def modify_params(self, old_params):
-        params = {}
-        for field in old_params.keys():
-            print(f"modify_params: {field}")
-            field_type =self.model_class._meta.get_field(field.split('__')[0]).get_internal_type()
-            if field_type == 'ForeignKey' and  "icontains" in field:
-                    params[f"{field.split('__')[0]}__id"] = old_params[field]
-            else:
-                params[field] = old_params[field]
-        return params
+        keys = tuple(data.keys()) if data else None
+        return list(_field_properties(self.model_class, keys))
     
+    def get_related_paths(self):
+        """Relations the serializer reads, computed once per (serializer_class, model_class)"""
+        key = (self.serializer_class, self.model_class)
+        paths = self._related_paths.get(key)
+        if paths is None:
+            paths = self._related_paths[key] = _auto_related(self.serializer_class, self.model_class)
+        return paths
+
+    def with_related(self, instances):
+        """Apply select_related/prefetch_related (and only_fields) for what the serializer reads"""
+        fk_paths, m2m_paths = self.get_related_paths()
+        if self.only_fields:
+            instances = instances.only(*self.only_fields, *fk_paths)
+        if fk_paths:
+            instances = instances.select_related(*fk_paths)
+        if m2m_paths:
+            instances = instances.prefetch_related(*m2m_paths)
+        return instances
+
     def get_queryset(self, params=None, ordering=None):
         """Get the queryset based on the given params"""
-        params = self.modify_params(params)
         if params is None:
             params = {}
         if "Q" in params:
@@ -141,7 +311,7 @@ class BaseAPIView(TenantUserAuthBackend, BaseExceptionHandlerMixin, APIView, Res
             instances = instances.order_by(ordering)
         else:
             instances = instances.order_by("-created_at")
-        return instances
+        return self.with_related(instances)
 
     def get_instance(self, pk=None, params=None):
         """Get the instance based on the given params"""
@@ -151,10 +321,10 @@ class BaseAPIView(TenantUserAuthBackend, BaseExceptionHandlerMixin, APIView, Res
             params["id"] = pk
         if hasattr(self.model_class, "asset") and "asset" in params:
             asset_id = params.pop('asset')
-            instance = get_assets_by_gfk(self.model_class, asset_id, **params).first()
+            instance = self.with_related(get_assets_by_gfk(self.model_class, asset_id, **params)).first()
         else:
             instance = self.model_class.objects.get_object_or_404(
-            raise_exception=True, **params)
+            raise_exception=True, queryset=self.with_related(self.model_class.objects.all()), **params)
         return instance
 
     def get_serialized_objects(self, instance, many=False):
@@ -162,22 +332,49 @@ class BaseAPIView(TenantUserAuthBackend, BaseExceptionHandlerMixin, APIView, Res
         serializer = self.serializer_class(instance, many=many)
         return serializer.data
 
+    def get_flat_rows(self, instances):
+        """
+        Serialize a list straight from .values() when the serializer only renders
+        plain columns; returns None when the regular serializer path is needed.
+        """
+        flat_fields = _flat_fields(self.serializer_class)
+        if (not flat_fields
+                or not isinstance(instances, QuerySet)
+                or instances.model is not self.serializer_class.Meta.model
+                or type(self).get_serialized_objects is not BaseAPIView.get_serialized_objects):
+            return None
+        # PrimaryKeyRelatedField renders the raw id that .values() already returns
+        converters = [(name, field.to_representation) for name, field in flat_fields
+                      if not isinstance(field, PrimaryKeyRelatedField)]
+        rows = list(instances.prefetch_related(None).values(*(name for name, _ in flat_fields)))
+        for row in rows:
+            for name, to_representation in converters:
+                value = row[name]
+                if value is not None:
+                    row[name] = to_representation(value)
+        return rows
+
+    def iter_serialized_batches(self, instances):
+        """Serialize a queryset batch by batch, reading it from the DB in chunks"""
+        rows = instances.iterator(chunk_size=self.stream_chunk_size)
+        while batch := list(islice(rows, self.stream_batch_size)):
+            yield self.get_serialized_objects(batch, many=True)
+
     def get_request_params(self, request):
         """
         Converts query params into Django filter kwargs,
-        skipping FK, M2M, and GFK fields from being wrapped in `__icontains`.
+        skipping FK, M2M, and GFK fields from being wrapped in `__icontains`,
+        and turning `<fk>__icontains` lookups into `<fk>__id`.
         """
-        model_fields = {f.name: f for f in self.model_class._meta.get_fields()}
-        gfk_field_names = {
-            f.name for f in self.model_class._meta.private_fields
-            if isinstance(f, GenericForeignKey)
-        }
-
         # Handle both DRF and regular Django requests
         if hasattr(request, 'query_params'):
             query_params = request.query_params
         else:
             query_params = request.GET
+        if not query_params:
+            return {}
+
+        internal_types, exact_names = _field_index(self.model_class)[4:]
 
         params = {}
         for key, value in query_params.items():
@@ -186,8 +383,12 @@ class BaseAPIView(TenantUserAuthBackend, BaseExceptionHandlerMixin, APIView, Res
 
             # Check if this is a nested lookup (contains multiple __)
             if '__' in key:
+                # Text search on a FK (e.g. "site__icontains") filters by the related id
+                base_field = key.split('__')[0]
+                if "icontains" in key and internal_types.get(base_field) == 'ForeignKey':
+                    params[f"{base_field}__id"] = value
                 # Handle __in lookups by splitting comma-separated values into lists
-                if key.endswith('__in'):
+                elif key.endswith('__in'):
                     params[key] = [v.strip() for v in value.split(',')]
                 # Handle __isnull lookups
                 elif key.endswith('__isnull'):
@@ -207,18 +408,11 @@ class BaseAPIView(TenantUserAuthBackend, BaseExceptionHandlerMixin, APIView, Res
                     params[key] = value
                 continue
 
-            field_name = key  # e.g., 'category'
-            field = model_fields.get(field_name)
-
-            is_gfk = key in gfk_field_names
-            is_fk = isinstance(field, ForeignKey) if field else False
-            is_m2m = isinstance(field, ManyToManyField) if field else False
-
             # Handle boolean values for non-nested fields
             if isinstance(value, str) and value.lower() in ['true', 'false']:
                 bool_val = value.lower() == 'true'
                 params[key] = bool_val
-            elif is_fk or is_m2m or is_gfk:
+            elif key in exact_names:
                 params[key] = value
             else:
                 params[f"{key}__icontains"] = value
@@ -248,8 +442,6 @@ class BaseAPIView(TenantUserAuthBackend, BaseExceptionHandlerMixin, APIView, Res
             if params is None:
                 params = self.get_request_params(request)
             params = self.clear_paginations_params(params)
-            if settings.DEBUG:
-                print(f"[{self.__class__.__name__}] GET pk: {pk}")
             if pk:
                 return self.retrieve(pk, params,  *args, **kwargs)
             else:
@@ -277,8 +469,12 @@ class BaseAPIView(TenantUserAuthBackend, BaseExceptionHandlerMixin, APIView, Res
             ordering_by = params.pop('ordering')
         user_lang = params.pop('lang', 'en')
         instance_objects = self.get_queryset(params=params, ordering=ordering_by)
-        serialized_data = self.get_serialized_objects(
-            instance_objects, many=True)
+        if self.stream_list:
+            return self.format_streaming_response(self.iter_serialized_batches(instance_objects), status_code=200)
+        serialized_data = self.get_flat_rows(instance_objects)
+        if serialized_data is None:
+            serialized_data = self.get_serialized_objects(
+                instance_objects, many=True)
         return self.format_response(data=serialized_data, status_code=200)
     
     def handle_post_params(self, request, params, allow_unauthenticated_user=False):
@@ -288,7 +484,8 @@ class BaseAPIView(TenantUserAuthBackend, BaseExceptionHandlerMixin, APIView, Res
         return params
     
     def handle_post_data(self, request):
-        data = request.data.copy()
+        # shallow: QueryDict.copy() deep-copies every value, uploaded files included
+        data = copy.copy(request.data)
         if "asset" in data:
             asset = data.pop("asset")
             data['content_type'], data['object_id'] = get_content_type_and_asset_id(asset)
@@ -320,7 +517,8 @@ class BaseAPIView(TenantUserAuthBackend, BaseExceptionHandlerMixin, APIView, Res
         return self.format_response(data=serializer.data, status_code=201)
 
     def handle_update_data(self, request):
-        data = request.data.copy()
+        # shallow: QueryDict.copy() deep-copies every value, uploaded files included
+        data = copy.copy(request.data)
         if "asset" in data:
             asset = data.pop("asset")
             data['content_type'], data['object_id'] = get_content_type_and_asset_id(asset)
@@ -1,35 +1,38 @@
-import traceback
+import logging
+
+from django.conf import settings
+
+
+logger = logging.getLogger(__name__)
+
+# checked in order, first attribute present on the exception wins
+_ERR_ATTRS = ("message", "detail", "errors", "error", "error_description")
+_STATUS_ATTRS = ("status_code", "code", "status")
+_MISSING = object()
 
 
 class BaseExceptionHandlerMixin:
     def handle_exception(self, e):
-        try:
-            raise e
-        except:
-            traceback.print_exc()
-            if hasattr(e, "message"):
-                error = e.message
-            elif hasattr(e, "detail"):
-                error = e.detail
-            elif hasattr(e, "errors"):
-                error = e.errors
-            elif hasattr(e, "error"):
-                error = e.error
-            elif hasattr(e, "error_description"):
-                error = e.error_description
-            else:
-                error = str(e)
-            if hasattr(e, "status_code"):
-                status_code = e.status_code
-            elif hasattr(e, "code"):
-                status_code = e.code
-            elif hasattr(e, "status"):
-                status_code = e.status
-            else:
-                status_code = 500
-            if not isinstance(status_code, int):
-                status_code = 500
-            if isinstance(error, dict) or isinstance(error, list):
-                return self.format_response(errors=error, status_code=status_code)
-            else:
-                return self.format_response(errors={"error": error}, status_code=status_code)
+        for attr in _ERR_ATTRS:
+            error = getattr(e, attr, _MISSING)
+            if error is not _MISSING:
+                break
+        else:
+            error = str(e)
+        for attr in _STATUS_ATTRS:
+            status_code = getattr(e, attr, _MISSING)
+            if status_code is not _MISSING:
+                break
+        else:
+            status_code = 500
+        if not isinstance(status_code, int):
+            status_code = 500
+        # client errors (validation, 404...) are not server failures: WARNING, not ERROR;
+        # full traceback only for server errors, or for everything in DEBUG
+        logger.log(logging.ERROR if status_code >= 500 else logging.WARNING,
+                   "API exception (%s): %r", status_code, e,
+                   exc_info=(type(e), e, e.__traceback__) if settings.DEBUG or status_code >= 500 else None)
+        if isinstance(error, dict) or isinstance(error, list):
+            return self.format_response(errors=error, status_code=status_code)
+        else:
+            return self.format_response(errors={"error": error}, status_code=status_code)
@@ -1,5 +1,9 @@
+import json
+
+from django.http import StreamingHttpResponse
 from rest_framework import status
 from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
 
 
 class ResponseFormatterMixin(object):
@@ -54,6 +58,42 @@ class ResponseFormatterMixin(object):
             response_data['fields'] = fields
         return Response(response_data, status=status_code)
 
+    def format_streaming_response(self, batches, status_code=None):
+        """
+            Streams the same envelope format_response builds for a list,
+            {"data": [...], "meta_data": {...}}, one batch at a time.
+
+            Errors raised while streaming cannot be turned into an error response,
+            the headers are already sent by then.
+
+            Args:
+                batches (Iterable[List[Dict]]): serialized rows, batch by batch.
+                status (int, optional): The HTTP status code to use.
+
+            Returns:
+                django.http.StreamingHttpResponse: the streamed JSON response.
+        """
+        status_code = status_code or status.HTTP_200_OK
+
+        def dumps(value):
+            return json.dumps(value, cls=JSONEncoder, ensure_ascii=False, separators=(",", ":"))
+
+        def stream():
+            total = 0
+            yield '{"data":['
+            for batch in batches:
+                if not batch:
+                    continue
+                yield ("," if total else "") + dumps(batch)[1:-1]
+                total += len(batch)
+            yield "],"
+            if not total:
+                yield '"errors":[],'
+            meta_data = {"success": True, "total": total, "status_code": status_code}
+            yield f'"meta_data":{dumps(meta_data)}}}'
+
+        return StreamingHttpResponse(stream(), status=status_code, content_type="application/json")
+
     def handle_complixe_data(self, data, errors, status_code=None):
         status_code = status_code or status.HTTP_207_MULTI_STATUS
         response_data = {"data": data, "errors": errors}
@@ -2,17 +2,21 @@ from configurations.base_features.views.base_api_view import BaseAPIView
 from configurations.base_features.exceptions.base_exceptions import LocalBaseException
 
 class SystemLevelView(BaseAPIView):
+    def get_is_system_level(self, pk):
+        """Read only the is_system_level flag, raising not_found for a missing row"""
+        is_system_level = self.model_class.objects.filter(pk=pk).values_list("is_system_level", flat=True).first()
+        if is_system_level is None:
+            raise LocalBaseException(
+                exception_type="not_found", status_code=404, kwargs={"model": self.model_class._meta.object_name})
+        return is_system_level
+
     def update(self, data, params, pk, partial, return_instance=False, *args, **kwargs):
-        instance = self.get_instance(pk)
-        if instance.is_system_level:
+        if self.get_is_system_level(pk):
             raise LocalBaseException(exception="System level maintenance type cannot be updated", status_code=400)
         return super().update(data, params, pk, partial, return_instance, *args, **kwargs)
 
     def destroy(self, request, pk, *args, **kwargs):
-        params = self.get_request_params(request)
-        params.pop('lang', 'en')
-        instance = self.get_instance(pk)
-        if instance.is_system_level:
+        if self.get_is_system_level(pk):
             raise LocalBaseException(exception="System level maintenance type cannot be deleted", status_code=400)
-        instance.delete()
-        return self.format_response(data={}, status_code=204)
\ No newline at end of file
+        self.model_class.objects.filter(pk=pk).delete()
+        return self.format_response(data={}, status_code=204)
@@ -5,10 +5,13 @@ import os
 
 bind = "0.0.0.0:8000"
 workers = multiprocessing.cpu_count() * 2 + 1
-threads = 2 * workers
-worker_class = "sync"
+# threads only take effect with a threaded worker; requests mostly wait on the DB
+worker_class = "gthread"
+threads = 4
 timeout = 120
-preload_app = True  # enables when_ready()
+# load the app in the master, warm the caches in when_ready(), then fork:
+# workers share the warmed pages copy-on-write instead of each rebuilding them
+preload_app = True
 
 accesslog = "-"
 errorlog = "-"
@@ -16,16 +19,20 @@ errorlog = "-"
 def when_ready(server):
     import django
     from django.conf import settings
-    from django.db import connection
+    from django.db import connection, connections
 
     print("[Gunicorn] Initializing Django...")
     os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'configurations.settings')
     django.setup()
 
-    print("[Gunicorn] Running system_start_checks()")
-    from configurations.system_start_checks import system_start_checks, Tenant
-    system_start_checks()
-    print(f"tenant names: {Tenant.objects.all().values_list('schema_name', flat=True)}")
+    # provisioning (system_start_checks) runs once per deploy: `manage.py bootstrap_system` in entrypoint.sh
+    from core.models import Tenant
+    tenant_names = list(Tenant.objects.values_list('schema_name', flat=True))
+    print(f"tenant names: {tenant_names}")
+
+    print("[Gunicorn] Warming view metadata caches")
+    from configurations.base_features.views.base_api_view import warm_view_caches
+    warm_view_caches()
     print({
         "ping": "pong",
         "schema": connection.schema_name,
@@ -33,4 +40,7 @@ def when_ready(server):
         "urlconf": settings.ROOT_URLCONF,
         "settings_module": os.environ.get("DJANGO_SETTINGS_MODULE", "not set"),
         "debug": settings.DEBUG,
-    })
\ No newline at end of file
+    })
+
+    # workers must not share the master's DB connection
+    connections.close_all()
@@ -5,13 +5,21 @@ Usage:
 1. Add FileAttachmentMixin to your model
 2. Add FileAttachmentSerializerMixin to your serializer  
 3. Add FileAttachmentViewMixin to your view (if you want set-image functionality)
-4. Run makemigrations and migrate
+4. Add FileAttachmentQuerysetMixin to your view to load file counts/image with the list query
+5. Run makemigrations and migrate
 """
 
+import hashlib
+from functools import cached_property, lru_cache
+from django.core.exceptions import FieldDoesNotExist
 from django.db import models
+from django.utils import timezone
+from django.utils.http import parse_etags
+from django.db.models import Count, Q
 from django.contrib.contenttypes.fields import GenericRelation
 from django.contrib.contenttypes.models import ContentType
 from rest_framework import serializers
+from rest_framework.response import Response
 from configurations.base_features.exceptions.base_exceptions import LocalBaseException
 
 
@@ -56,17 +64,22 @@ class FileAttachmentMixin(models.Model):
     class Meta:
         abstract = True
     
+    @cached_property
+    def _not_deleted_files(self):
+        """Unevaluated non-deleted files queryset, built once per instance; callers chain or .all() it"""
+        return self.files.not_deleted()
+    
     def get_image_files(self):
         """Get all image files uploaded for this object"""
-        return self.files.not_deleted().images()
+        return self._not_deleted_files.images()
     
     def get_all_files(self):
         """Get all files uploaded for this object (excluding deleted)"""
-        return self.files.not_deleted()
+        return self._not_deleted_files.all()
     
     def get_documents(self):
         """Get all document files uploaded for this object"""
-        return self.files.not_deleted().documents()
+        return self._not_deleted_files.documents()
     
     def set_image(self, file_upload):
         """
@@ -74,12 +87,12 @@ class FileAttachmentMixin(models.Model):
         Validates that the file belongs to this object and is an image.
         """
         if file_upload is None:
-            self.image = None
-            self.save(update_fields=['image'])
+            self._update_image(None)
             return True
             
-        # Validate that the file belongs to this object
-        if not self.files.filter(id=file_upload.id).exists():
+        # Validate that the file belongs to this object (get_for_model is cached, no query)
+        if (file_upload.object_id != self.pk
+                or file_upload.content_type_ref_id != ContentType.objects.get_for_model(self).id):
             raise ValueError("File must be uploaded for this object first")
         
         # Validate that the file is an image
@@ -90,10 +103,23 @@ class FileAttachmentMixin(models.Model):
         if file_upload.is_deleted:
             raise ValueError("Cannot use deleted file as image")
         
-        self.image = file_upload
-        self.save(update_fields=['image'])
+        self._update_image(file_upload)
         return True
     
+    def _update_image(self, file_upload):
+        """
+        Store the main image with a single UPDATE, skipping save() and its signals;
+        updated_at is bumped by hand since auto_now only applies on save().
+        """
+        values = {"image_id": file_upload.pk if file_upload else None}
+        if values["image_id"] == self.image_id:
+            # unchanged: no write, and updated_at (hence the set-image ETag) stays put
+            return
+        if hasattr(self, 'updated_at'):
+            values["updated_at"] = self.updated_at = timezone.now()
+        type(self).objects.filter(pk=self.pk).update(**values)
+        self.image = file_upload
+    
     def get_image_url(self):
         """Get the URL for the object's main image"""
         if self.image and not self.image.is_deleted:
@@ -101,6 +127,95 @@ class FileAttachmentMixin(models.Model):
         return None
 
 
+@lru_cache(maxsize=None)
+def file_capabilities(model_class):
+    """(has_files, has_image) for a model class, resolved once per class instead of per row"""
+    try:
+        has_image = isinstance(model_class._meta.get_field('image'), models.ForeignKey)
+    except FieldDoesNotExist:
+        has_image = False
+    return hasattr(model_class, 'files'), has_image
+
+
+@lru_cache(maxsize=None)
+def file_response_template(model_class):
+    """
+    Per-model parts of the `files` response block, built once:
+    (files_endpoint prefix, set_image_endpoint prefix, upload_example without link_to_id).
+    Only the instance id is filled in per row.
+    """
+    app_label = model_class._meta.app_label
+    model_name = model_class._meta.model_name
+    full_model_name = model_class._meta.label_lower
+    upload_example = {
+        "method": "POST",
+        "url": "/v1/api/file-uploads/files/",
+        "content_type": "multipart/form-data",
+        "data": {
+            "file": "<file_object>",
+            "link_to_model": full_model_name,
+            "link_to_id": None,
+            "description": "Optional description",
+            "tags": "Optional,comma,separated,tags"
+        }
+    }
+    return (
+        f"/v1/api/file-uploads/files/?link_to_model={full_model_name}&object_id=",
+        f"/v1/api/{app_label}/{model_name}/",
+        upload_example,
+    )
+
+
+def _image_info(image):
+    if image is None or image.is_deleted:
+        return None
+    return {
+        "id": str(image.id),
+        "url": image.get_file_url(),
+        "original_filename": image.original_filename,
+        "file_size": image.file_size,
+        "download_url": image.get_download_url()
+    }
+
+
+def _skip_file_info(serializer, instance, response):
+    return response
+
+
+@lru_cache(maxsize=None)
+def file_info_appender(model_class):
+    """
+    Function (serializer, instance, response) -> response adding the image/files
+    blocks for `model_class`. Capabilities and endpoint templates are decided here,
+    once per class; the returned closure only does the per-row work.
+    """
+    has_files, has_image = file_capabilities(model_class)
+    if not (has_files or has_image):
+        return _skip_file_info
+    files_endpoint, model_endpoint, upload_example = file_response_template(model_class)
+    upload_data = upload_example["data"]
+    
+    def append_file_info(serializer, instance, response):
+        response['image'] = _image_info(instance.image) if has_image else None
+        if has_files:
+            file_counts = serializer.get_file_counts(instance)
+            instance_id = str(instance.id)
+            files = response['files'] = {
+                "total_count": file_counts["total"],
+                "images_count": file_counts["images"],
+                "documents_count": file_counts["documents"],
+                "files_endpoint": files_endpoint + instance_id,
+                "upload_endpoint": "/v1/api/file-uploads/files/",
+                "upload_example": {**upload_example, "data": {**upload_data, "link_to_id": instance_id}},
+            }
+            # Add set-image endpoint if the model has an image field
+            if has_image:
+                files["set_image_endpoint"] = f"{model_endpoint}{instance_id}/set-image/"
+        return response
+    
+    return append_file_info
+
+
 class FileAttachmentSerializerMixin:
     """
     Mixin to add file information to serializer responses
@@ -114,65 +229,63 @@ class FileAttachmentSerializerMixin:
     This automatically adds file and image information to API responses
     """
     
+    def get_file_counts(self, instance):
+        """
+        Total/image/document counts of the instance's non-deleted files,
+        in one aggregate query, cached on the instance.
+        """
+        counts = getattr(instance, '_file_counts', None)
+        if counts is None and hasattr(instance, '_files_total'):
+            # annotated by FileAttachmentQuerysetMixin.with_file_info
+            counts = instance._file_counts = {
+                "total": instance._files_total,
+                "images": instance._files_images,
+                "documents": instance._files_documents,
+            }
+        if counts is None:
+            from file_uploads.models import DOCUMENT_CONTENT_TYPES, IMAGE_CONTENT_TYPES
+            counts = instance._file_counts = instance._not_deleted_files.aggregate(
+                total=Count('id'),
+                images=Count('id', filter=Q(content_type__in=IMAGE_CONTENT_TYPES)),
+                documents=Count('id', filter=Q(content_type__in=DOCUMENT_CONTENT_TYPES)),
+            )
+        return counts
+    
     def add_file_info_to_response(self, instance, response):
         """Add file attachment information to the serializer response"""
-        
-        # Add image information
-        response['image'] = None
-        if hasattr(instance, 'image') and instance.image and not instance.image.is_deleted:
-            response['image'] = {
-                "id": str(instance.image.id),
-                "url": instance.image.get_file_url(),
-                "original_filename": instance.image.original_filename,
-                "file_size": instance.image.file_size,
-                "download_url": instance.image.get_download_url()
-            }
-        
-        # Add files information
-        if hasattr(instance, 'files'):
-            files_count = instance.files.not_deleted().count()
-            images_count = instance.files.not_deleted().images().count()
-            
-            # Generate model name for API endpoints
-            app_label = instance._meta.app_label
-            model_name = instance.__class__.__name__.lower()
-            full_model_name = f"{app_label}.{model_name}"
-            
-            response['files'] = {
-                "total_count": files_count,
-                "images_count": images_count,
-                "documents_count": instance.files.not_deleted().documents().count(),
-                "files_endpoint": f"/v1/api/file-uploads/files/?link_to_model={full_model_name}&object_id={instance.id}",
-                "upload_endpoint": "/v1/api/file-uploads/files/",
-                "upload_example": {
-                    "method": "POST",
-                    "url": "/v1/api/file-uploads/files/",
-                    "content_type": "multipart/form-data",
-                    "data": {
-                        "file": "<file_object>",
-                        "link_to_model": full_model_name,
-                        "link_to_id": str(instance.id),
-                        "description": "Optional description",
-                        "tags": "Optional,comma,separated,tags"
-                    }
-                }
-            }
-            
-            # Add set-image endpoint if the model has an image field
-            if hasattr(instance, 'image'):
-                response['files']["set_image_endpoint"] = f"/v1/api/{app_label}/{model_name}/{instance.id}/set-image/"
-        
-        return response
+        return file_info_appender(type(instance))(self, instance, response)
     
     def mod_to_representation(self, instance):
         """Override to automatically add file information"""
         response = super().mod_to_representation(instance)
-        
-        # Add file information if the instance has file capabilities
-        if hasattr(instance, 'files') or hasattr(instance, 'image'):
-            response = self.add_file_info_to_response(instance, response)
-        
-        return response
+        # no-op for models without file capabilities
+        return file_info_appender(type(instance))(self, instance, response)
+
+
+class FileAttachmentQuerysetMixin:
+    """
+    Mixin for views serializing FileAttachmentMixin models in bulk
+    
+    Usage:
+        class WorkOrderBaseView(FileAttachmentQuerysetMixin, BaseAPIView):
+            pass
+    
+    The list queryset gets the image joined and the file counts annotated, so
+    FileAttachmentSerializerMixin issues no per-row queries.
+    """
+    
+    def with_file_info(self, queryset):
+        """Join the main image and annotate non-deleted file counts"""
+        from file_uploads.models import DOCUMENT_CONTENT_TYPES, IMAGE_CONTENT_TYPES
+        not_deleted = Q(files__is_deleted=False)
+        return queryset.select_related('image').annotate(
+            _files_total=Count('files', filter=not_deleted, distinct=True),
+            _files_images=Count('files', filter=not_deleted & Q(files__content_type__in=IMAGE_CONTENT_TYPES), distinct=True),
+            _files_documents=Count('files', filter=not_deleted & Q(files__content_type__in=DOCUMENT_CONTENT_TYPES), distinct=True),
+        )
+    
+    def get_queryset(self, params=None, ordering=None):
+        return self.with_file_info(super().get_queryset(params, ordering))
 
 
 class FileAttachmentViewMixin:
@@ -187,22 +300,39 @@ class FileAttachmentViewMixin:
     This adds the set_image method for managing main images
     """
     
+    @staticmethod
+    def image_etag(instance):
+        """Weak validator for an object's main image state"""
+        updated_at = getattr(instance, 'updated_at', None)
+        state = f"{instance.pk}:{instance.image_id}:{updated_at.timestamp() if updated_at else ''}"
+        return 'W/"%s"' % hashlib.md5(state.encode()).hexdigest()
+    
     def set_image(self, request, pk, *args, **kwargs):
         """
         Set the main image for an object from one of its uploaded files.
         Expects: {"file_id": "uuid-of-uploaded-file"} or {"file_id": null} to remove image
+        Returns {"id", "image_id", "message"}; pass ?full=1 for the fully serialized object.
+        If-None-Match matching the current image state (or "*") fails with 412, nothing is written.
         """
         try:
             # Get the object instance
             instance = self.get_instance(pk)
             
             # Check if the model supports images
-            if not hasattr(instance, 'image'):
+            if not file_capabilities(type(instance))[1]:
                 raise LocalBaseException(
                     exception="This model does not support image attachments",
                     status_code=400
                 )
             
+            # Precondition on the state before the write (RFC 9110 13.1.2, unsafe method)
+            etag = self.image_etag(instance)
+            if_none_match = request.headers.get('If-None-Match')
+            if if_none_match:
+                client_etags = {tag.removeprefix('W/') for tag in parse_etags(if_none_match)}
+                if '*' in client_etags or etag.removeprefix('W/') in client_etags:
+                    return Response(status=412, headers={"ETag": etag})
+            
             # Get request data
             data = request.data
             file_id = data.get('file_id')
@@ -232,11 +362,21 @@ class FileAttachmentViewMixin:
                         status_code=400
                     )
             
-            # Return updated object data
-            response_data = self.serializer_class(instance).data
-            response_data['message'] = message
+            # Acknowledge with the new image id; the full object only on ?full=1
+            etag = self.image_etag(instance)
+            if request.query_params.get('full') in ('1', 'true'):
+                response_data = self.serializer_class(instance, context={"request": request}).data
+                response_data['message'] = message
+            else:
+                response_data = {
+                    "id": str(instance.id),
+                    "image_id": str(instance.image_id) if instance.image_id else None,
+                    "message": message,
+                }
             
-            return self.format_response(data=response_data, status_code=200)
+            response = self.format_response(data=response_data, status_code=200)
+            response['ETag'] = etag
+            return response
             
         except Exception as e:
             return self.handle_exception(e)
\ No newline at end of file
@@ -1,11 +1,9 @@
 import os
 from configurations.settings_details.env import env, BASE_DIR
 from configurations.settings_details.django.installed_apps import (
-    BASE_APPS,
-    PROJECT_APPS,
-    THIRD_PARTY_APPS,
+    INSTALLED_APPS,
+    SHARED_APPS,
     TENANT_APPS,
-    
 )
 # Import BASE_DOMAIN
 from configurations.settings_details.django.project_data import BASE_DOMAIN
@@ -44,20 +42,14 @@ AUTH_USER_MODEL = 'admin_users.AdminUser'
 ROOT_URLCONF = 'configurations.urls'
 
 
-# Application definition
-SHARED_APPS = [*BASE_APPS,
-               *PROJECT_APPS,
-               *THIRD_PARTY_APPS]
-INSTALLED_APPS = [
-    *SHARED_APPS,
-    *TENANT_APPS
-]
+# Application definition: SHARED_APPS, TENANT_APPS and INSTALLED_APPS come from installed_apps
 
 
 MIDDLEWARE = [
-    'django_tenants.middleware.main.TenantMainMiddleware',  # Move this to the top
+    # tenant resolution first: the search_path must be set before sessions/auth touch the DB
+    'configurations.base_features.middlewares.subdomain_middleware.CachedTenantMainMiddleware',
     'configurations.base_features.middlewares.subdomain_middleware.SubdomainTenantMiddleware',
-    "corsheaders.middleware.CorsMiddleware",
+    'configurations.base_features.middlewares.cors_middleware.CachedCorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -0,0 +1,16 @@
+from configurations.settings_details.env import env
+
+# Shared cache backend: every gunicorn worker and Celery process must see the same
+# entries, or the tenant cache invalidation in core/signals.py only reaches the
+# process that did the write. Defaults to the Redis Celery uses, on its own DB
+# number (REDIS_CACHE_DB); CACHE_URL (e.g. rediscache://redis:6379/1) overrides it.
+_redis_password = env('REDIS_PASSWORD', default='')
+_redis_auth = f":{_redis_password}@" if _redis_password else ""
+CACHES = {
+    'default': env.cache('CACHE_URL', default='rediscache://{auth}{host}:{port}/{db}'.format(
+        auth=_redis_auth,
+        host=env('REDIS_HOST', default='localhost'),
+        port=env('REDIS_PORT', default='6379'),
+        db=env('REDIS_CACHE_DB', default='1'),
+    )),
+}
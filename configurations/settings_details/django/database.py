@@ -1,34 +1,37 @@
 from configurations.settings_details.env import env
-from django.conf import settings
 
-enviroment = "STAGE_" if settings.DEBUG else "PROD_"
 # Database
-import os
-# import dj_database_url
-
-
-CONN_HEALTH_CHECKS = True
-DATABASES = {
-    'default': {
-        'ENGINE': "django_tenants.postgresql_backend",
+# Read straight from the environment: going through django.conf.settings here
+# would re-enter settings initialisation while this module is being imported.
+# DATABASE_URL (one parsed URL) wins when set, otherwise the POSTGRES_* variables.
+if env.str('DATABASE_URL', default=''):
+    _default_db = env.db('DATABASE_URL')
+else:
+    _default_db = {
         'NAME': env('POSTGRES_DB'),
         'USER': env('POSTGRES_USER'),
         'PASSWORD': env('POSTGRES_PASSWORD'),
         'HOST': env('POSTGRES_HOST'),
         'PORT': env('POSTGRES_PORT'),
     }
+
+DATABASES = {
+    'default': {
+        **_default_db,
+        # Required for django-tenants to work
+        'ENGINE': "django_tenants.postgresql_backend",
+        # persistent connections, checked before reuse, instead of a new handshake per request
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            **_default_db.get('OPTIONS', {}),
+            # cap runaway queries (milliseconds) so they cannot pin a worker's connection
+            'options': f"-c statement_timeout={env.int('POSTGRES_STATEMENT_TIMEOUT', default=30000)}",
+            'sslmode': env.str('POSTGRES_SSLMODE', default='prefer'),
+        },
+    }
 }
 # DATABASES = {
-#     'default': dj_database_url.config(
-#         default=os.getenv("DATABASE_URL"),  # safe default if running locally
-#         conn_max_age=600,
-#         ssl_require=True
-#     )
-# }
-
-# # Required for django-tenants to work
-# DATABASES['default']['ENGINE'] = 'django_tenants.postgresql_backend'
-
     # 'default': {
     #     'ENGINE': env(f"{enviroment}DATABASE_ENGINE"),
     #     'NAME': env(f"{enviroment}DATABASE_NAME"),
@@ -1,4 +1,4 @@
-BASE_APPS = [
+BASE_APPS = (
     'django_tenants',
     'whitenoise.runserver_nostatic',
     'django.contrib.admin',
@@ -7,22 +7,21 @@ BASE_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
-]
-THIRD_PARTY_APPS = [
+)
+THIRD_PARTY_APPS = (
     'rest_framework',
     "corsheaders",
     'rest_framework_simplejwt',
     "django_extensions",
     "django_celery_beat",
     # "rest_framework_simplejwt.token_blacklist",
-
-]
-PROJECT_APPS = [
+)
+PROJECT_APPS = (
     'admin_users.apps.AdminUsersConfig',
     'core.apps.CoreConfig',
     'custom_commands.apps.CustomCommandsConfig',
-]
-TENANT_APPS = [
+)
+TENANT_APPS = (
     'tenant_users.apps.TenantUsersConfig',
     'company.apps.CompanyConfig',
     'assets.apps.AssetsConfig',
@@ -37,4 +36,8 @@ TENANT_APPS = [
     "components.apps.ComponentsConfig",
     "parts.apps.PartsConfig",
     "vendors.apps.VendorsConfig",
-]
+)
+
+# Concatenated once here; django-tenants syncs SHARED_APPS to the public schema
+SHARED_APPS = BASE_APPS + PROJECT_APPS + THIRD_PARTY_APPS
+INSTALLED_APPS = SHARED_APPS + TENANT_APPS
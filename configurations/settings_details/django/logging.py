@@ -0,0 +1,25 @@
+# API exceptions are formatted in the request thread and handed to a queue;
+# a background thread does the stderr write so request threads never wait on it.
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'verbose': {
+            'format': '{asctime} {levelname} {name} {message}',
+            'style': '{',
+        },
+    },
+    'handlers': {
+        'background_console': {
+            '()': 'configurations.base_features.helpers.log_handlers.BackgroundStreamHandler',
+            'formatter': 'verbose',
+        },
+    },
+    'loggers': {
+        'configurations.base_features.views': {
+            'handlers': ['background_console'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+    },
+}
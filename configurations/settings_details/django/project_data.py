@@ -3,3 +3,8 @@ from django.conf import settings
 
 
 BASE_DOMAIN = "api.alfrih.com" # if settings.DEBUG == False else "localhost"
+
+# seconds an asset id -> content type id mapping stays in the cache
+ASSET_CONTENT_TYPE_CACHE_TTL = 60 * 60
+# seconds list_active_tasks reuses one worker inspect() broadcast
+TASKS_INSPECT_CACHE_TTL = 3
@@ -1,4 +1,4 @@
-import os
+from configurations.celery_routes import TaskModuleRouter
 from configurations.settings_details.env import env
 
 # Celery Configuration Options
@@ -9,22 +9,17 @@ REDIS_PORT = env('REDIS_PORT', default='6379')
 REDIS_PASSWORD = env('REDIS_PASSWORD', default='')
 REDIS_DB = env('REDIS_DB', default='0')
 
-# Build Redis URL
-if REDIS_PASSWORD:
-    CELERY_BROKER_URL = f'redis://:{REDIS_PASSWORD}@{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}'
-    CELERY_RESULT_BACKEND = f'redis://:{REDIS_PASSWORD}@{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}'
-else:
-    CELERY_BROKER_URL = f'redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}'
-    CELERY_RESULT_BACKEND = f'redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}'
-
-# Fallback to environment variable if set
-CELERY_BROKER_URL = env('REDIS_URL', default=CELERY_BROKER_URL)
-CELERY_RESULT_BACKEND = env('REDIS_URL', default=CELERY_RESULT_BACKEND)
+# Build Redis URL; REDIS_URL, when set, takes precedence over the individual parts
+_redis_auth = f":{REDIS_PASSWORD}@" if REDIS_PASSWORD else ""
+CELERY_BROKER_URL = CELERY_RESULT_BACKEND = (
+    env('REDIS_URL', default=None) or f'redis://{_redis_auth}{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}'
+)
 
 # Celery Settings
-CELERY_ACCEPT_CONTENT = ['application/json']
-CELERY_TASK_SERIALIZER = 'json'
-CELERY_RESULT_SERIALIZER = 'json'
+# 'orjson' is registered with kombu in configurations/celery.py
+CELERY_ACCEPT_CONTENT = ['application/json', 'application/x-orjson']
+CELERY_TASK_SERIALIZER = 'orjson'
+CELERY_RESULT_SERIALIZER = 'orjson'
 CELERY_TIMEZONE = 'UTC'
 
 # Celery Beat Configuration
@@ -54,14 +49,28 @@ CELERY_RESULT_EXPIRES = 3600  # 1 hour
 CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
 CELERY_BROKER_CONNECTION_RETRY = True
 CELERY_BROKER_CONNECTION_MAX_RETRIES = 10
+# Producers reuse pooled, kept-alive Redis connections instead of reconnecting (and re-AUTHing) per publish
+CELERY_BROKER_POOL_LIMIT = 32
+CELERY_BROKER_TRANSPORT_OPTIONS = {
+    'socket_keepalive': True,
+    'socket_timeout': 5,
+    'retry_on_timeout': True,
+    'health_check_interval': 30,
+}
+CELERY_REDIS_SOCKET_KEEPALIVE = True
+CELERY_REDIS_MAX_CONNECTIONS = 64
+CELERY_RESULT_BACKEND_TRANSPORT_OPTIONS = {
+    'retry_policy': {'timeout': 5.0},
+}
 
 # Task routing (optional - for advanced usage)
-CELERY_TASK_ROUTES = {
-    'pm_automation.tasks.*': {'queue': 'automation'},
-    'assets.tasks.*': {'queue': 'assets'},
-    'financial_reports.tasks.*': {'queue': 'reports'},
+# Routed by task module ('<app>.tasks'), one dict lookup per dispatch
+CELERY_TASK_ROUTES = (TaskModuleRouter({
+    'pm_automation.tasks': {'queue': 'automation'},
+    'assets.tasks': {'queue': 'assets'},
+    'financial_reports.tasks': {'queue': 'reports'},
     # Add more app-specific queues as needed
-}
+}),)
 
 # Default queue
 CELERY_TASK_DEFAULT_QUEUE = 'default'
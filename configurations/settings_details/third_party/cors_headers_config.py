@@ -1,18 +1,25 @@
+import re
+
 from django.conf import settings
 
 CORS_ALLOW_ALL_ORIGINS = settings.DEBUG  # True for dev, False for prod
-CORS_ALLOWED_ORIGINS = [
+CORS_ALLOWED_ORIGINS = (
     "http://localhost:3000",
     "http://*.localhost:3000",
     "http://127.0.0.1:3000",
     "https://alfrih.com",
     "https://lovable.app",
     "https://preview--groovy-new-beginnings-flow-91.lovable.app",
-]
-CORS_ORIGIN_REGEX_WHITELIST = [
+)
+# Compiled once here; corsheaders matches pattern objects as-is instead of looking
+# each string up in re's compile cache on every CORS request
+CORS_ALLOWED_ORIGIN_REGEXES = tuple(re.compile(pattern) for pattern in (
     r"^https:\/\/([a-zA-Z0-9_-]+\.)*alfrih\.com$",  # matches any subdomain like *.alfrih.com
-    r"^https:\/\/([a-zA-Z0-9_-]+\.)*lovable\.app$",  # matches any subdomain like *.alfrih.com
-]
+    r"^https:\/\/([a-zA-Z0-9_-]+\.)*lovable\.app$",  # matches any subdomain like *.lovable.app
+))
 CORS_ALLOW_CREDENTIALS = True
 
-CSRF_TRUSTED_ORIGINS = [origin.replace("http", "https") for origin in CORS_ALLOWED_ORIGINS if "localhost" not in origin]
+# Same hosts forced to https; swaps the scheme so "https://" origins are not turned into "httpss://"
+CSRF_TRUSTED_ORIGINS = tuple(
+    "https://" + origin.split("://", 1)[1] for origin in CORS_ALLOWED_ORIGINS if "localhost" not in origin
+)
@@ -1,17 +1,17 @@
 from datetime import timedelta
 
 
-
+# plain dicts, so Django's error reports still mask sensitive entries (e.g. a SIGNING_KEY)
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
         "rest_framework_simplejwt.authentication.JWTAuthentication",
     ),
-    "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer"
-    ],
-    "DEFAULT_PARSER_CLASSES": [
-        "rest_framework.parsers.JSONParser"
-    ],
+    "DEFAULT_RENDERER_CLASSES": (
+        "rest_framework.renderers.JSONRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "rest_framework.parsers.JSONParser",
+    ),
     "EXCEPTION_HANDLER": "rest_framework.views.exception_handler",  # Optional if not overridden
 }
 
@@ -20,5 +20,4 @@ SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(days=10),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=100),
     "UPDATE_LAST_LOGIN": True,
-    
-}
\ No newline at end of file
+}
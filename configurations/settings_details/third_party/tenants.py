@@ -2,4 +2,17 @@
 TENANT_MODEL = 'core.Tenant'
 TENANT_DOMAIN_MODEL = 'core.Domain'
 PUBLIC_SCHEMA_URLCONF = 'core.urls'
-SITE_ID = 1
\ No newline at end of file
+SITE_ID = 1
+# skip repeated SET search_path round trips within one request or schema_context; every
+# set_tenant()/set_schema() resets it, so nothing carries over between requests (no CONN_MAX_AGE gain)
+TENANT_LIMIT_SET_CALLS = True
+
+# seconds a resolved hostname -> tenant entry stays in the cache
+TENANT_CACHE_TTL = 300
+# seconds a worker reuses a tenant without asking the shared cache again
+TENANT_LOCAL_CACHE_TTL = 5
+# seconds an unknown hostname is remembered as having no tenant
+TENANT_MISS_CACHE_TTL = 60
+# seconds the list of tenant schema names used by the periodic tasks stays cached;
+# short, as a bound for changes that bypass the Tenant signals (queryset updates, raw SQL)
+TENANT_SCHEMAS_CACHE_TTL = 60
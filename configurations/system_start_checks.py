@@ -1,44 +1,62 @@
-
+import logging
 
 from django.conf import settings
+from django.db import DatabaseError, transaction
 from core.models import Domain, HighLevelMaintenanceType, Tenant, WorkOrderStatusControls
 from django_tenants.utils import schema_context
 
 from tenant_users.models import TenantUser
 
+logger = logging.getLogger(__name__)
+
 def public_tenant_check():
     try:
-        tenant = Tenant.objects.filter(schema_name='public')
-        if not tenant.exists():
-            # create your public tenant
-            tenant = Tenant(schema_name='public',
-                            name='Tenmil Inc.',
-                            paid_until='2100-12-05',
-                            on_trial=False)
-            tenant.save()
+        # public + default tenant and their domains land together or not at all
+        with transaction.atomic():
+            tenant = Tenant.objects.filter(schema_name='public')
+            if not tenant.exists():
+                # create your public tenant
+                tenant = Tenant(schema_name='public',
+                                name='Tenmil Inc.',
+                                paid_until='2100-12-05',
+                                on_trial=False)
+                tenant.save()
+
+                # Add one or more domains for the tenant
+                domain = Domain()
+                domain.domain = f"{settings.BASE_DOMAIN}" # don't add your port or www here! on a local server you'll want to use localhost here
+                domain.tenant = tenant
+                domain.is_primary = True
+                domain.save()
 
-            # Add one or more domains for the tenant
-            domain = Domain()
-            domain.domain = f"{settings.BASE_DOMAIN}" # don't add your port or www here! on a local server you'll want to use localhost here
-            domain.tenant = tenant
-            domain.is_primary = True
-            domain.save()
+                # create your schema tenant
+                tenant = Tenant(schema_name='tenmil',
+                                name='Tenmil Inc.',
+                                paid_until='2100-12-05',
+                                on_trial=False)
+                tenant.save()
 
-            # create your schema tenant
-            tenant = Tenant(schema_name='tenmil',
-                            name='Tenmil Inc.',
-                            paid_until='2100-12-05',
-                            on_trial=False)
-            tenant.save()
+                # Add one or more domains for the tenant
+                domain = Domain()
+                domain.domain = f"tenmil.{settings.BASE_DOMAIN}" # don't add your port or www here! on a local server you'll want to use localhost here
+                domain.tenant = tenant
+                domain.is_primary = True
+                domain.save()
+    except DatabaseError:
+        logger.exception("public_tenant_check failed")
 
-            # Add one or more domains for the tenant
-            domain = Domain()
-            domain.domain = f"tenmil.{settings.BASE_DOMAIN}" # don't add your port or www here! on a local server you'll want to use localhost here
-            domain.tenant = tenant
-            domain.is_primary = True
-            domain.save()
-    except:
-        pass
+
+def create_missing_controls(model, default_actions):
+    """
+        insert the default rows whose key is not there yet:
+        one SELECT for the existing keys, one INSERT for the rest
+    """
+    with transaction.atomic():
+        existing = set(model.objects.values_list("key", flat=True))
+        model.objects.bulk_create(
+            [model(**action) for action in default_actions if action["key"] not in existing],
+            ignore_conflicts=True,
+        )
 
 
 def work_order_status_actions_check():
@@ -71,8 +89,7 @@ def work_order_status_actions_check():
             "order": 4
         }
     ]
-    for action in default_actions:
-        WorkOrderStatusControls.objects.get_or_create(**action)
+    create_missing_controls(WorkOrderStatusControls, default_actions)
 
 def scheduled_maintenance_actions_check():
     """
@@ -104,8 +121,7 @@ def scheduled_maintenance_actions_check():
             "order": 4
         }
     ]
-    for action in default_actions:
-        HighLevelMaintenanceType.objects.get_or_create(**action)
+    create_missing_controls(HighLevelMaintenanceType, default_actions)
 
 def ittiration_cycle_checklist():
     """
@@ -114,17 +130,18 @@ def ittiration_cycle_checklist():
     pass
 
 def system_user():
-    tenants = Tenant.objects.all()
-    for tenant in tenants:
-        if tenant.schema_name != 'public':
-            with schema_context(tenant.schema_name):
-                try:
-                    user = TenantUser.objects.get(email=f'Sys_Admin@{tenant.schema_name}.tenmil.ca')
-                except TenantUser.DoesNotExist:
-                    user = TenantUser.objects.create_user(email=f'Sys_Admin@{tenant.schema_name}.tenmil.ca', name="System Admin", password='admin', tenant=tenant)
-                user.is_superuser = True
-                user.is_staff = True
-                user.save()
+    tenants = Tenant.objects.exclude(schema_name='public').only('id', 'schema_name')
+    for tenant in tenants.iterator(chunk_size=500):
+        with schema_context(tenant.schema_name):
+            email = f'Sys_Admin@{tenant.schema_name}.tenmil.ca'
+            users = TenantUser.objects.filter(email=email)
+            flags = users.values_list('is_superuser', 'is_staff').first()
+            if flags is None:
+                # password only on create, hashed by the manager
+                TenantUser.objects.create_user(email=email, name="System Admin", password='admin', tenant=tenant,
+                                               is_superuser=True, is_staff=True)
+            elif not all(flags):
+                users.update(is_superuser=True, is_staff=True)
 
 def system_start_checks():   
     """
@@ -137,5 +154,5 @@ def system_start_checks():
         ittiration_cycle_checklist()
         system_user()
         print("system_start_checks Succeed")
-    except:
-        print("system_start_checks Failed")
\ No newline at end of file
+    except DatabaseError:
+        logger.exception("system_start_checks Failed")
\ No newline at end of file
@@ -2,14 +2,34 @@ from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from django.conf import settings
+from django.core.cache import cache
 from django.http import JsonResponse
 from celery.result import AsyncResult
+from celery.states import FAILURE, READY_STATES, SUCCESS
 from django.views.decorators.csrf import csrf_exempt
 import json
+from types import MappingProxyType
 
 # Import tasks
 from .tasks import sample_async_task, on_demand_error_log, robust_background_task
 from .celery import app as celery_app
+from .serializers import BackgroundTaskTriggerSerializer, ErrorLogTaskTriggerSerializer, SampleTaskTriggerSerializer
+
+# Tasks trigger_task_from_code can dispatch by name
+_TASK_MAPPING = MappingProxyType({
+    'sample_async_task': sample_async_task,
+    'on_demand_error_log': on_demand_error_log,
+    'robust_background_task': robust_background_task,
+})
+_INSPECT_CACHE_KEY = "celery:inspect:active_scheduled"
+
+
+def _invalid_trigger(serializer):
+    return Response({
+        'success': False,
+        'error': serializer.errors
+    }, status=status.HTTP_400_BAD_REQUEST)
 
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
@@ -19,12 +39,12 @@ def trigger_sample_task(request):
     POST /api/tasks/sample/
     Body: {"message": "Your custom message"}
     """
+    serializer = SampleTaskTriggerSerializer(data=request.data)
+    if not serializer.is_valid():
+        return _invalid_trigger(serializer)
     try:
-        data = request.data
-        message = data.get('message', 'Task triggered from API')
-        
         # Trigger the task asynchronously
-        task_result = sample_async_task.delay(message)
+        task_result = sample_async_task.delay(serializer.validated_data['message'])
         
         return Response({
             'success': True,
@@ -47,12 +67,12 @@ def trigger_error_log(request):
     POST /api/tasks/error-log/
     Body: {"message": "Custom error message"}
     """
+    serializer = ErrorLogTaskTriggerSerializer(data=request.data)
+    if not serializer.is_valid():
+        return _invalid_trigger(serializer)
     try:
-        data = request.data
-        custom_message = data.get('message', 'Error triggered via API')
-        
         # Trigger the error log task
-        task_result = on_demand_error_log.delay(custom_message)
+        task_result = on_demand_error_log.delay(serializer.validated_data['message'])
         
         return Response({
             'success': True,
@@ -75,11 +95,12 @@ def trigger_background_task(request):
     POST /api/tasks/background/
     Body: {"data": {"key": "value", "any": "data"}}
     """
+    serializer = BackgroundTaskTriggerSerializer(data=request.data)
+    if not serializer.is_valid():
+        return _invalid_trigger(serializer)
     try:
-        data = request.data.get('data', {})
-        
         # Trigger the background task
-        task_result = robust_background_task.delay(data)
+        task_result = robust_background_task.delay(serializer.validated_data['data'])
         
         return Response({
             'success': True,
@@ -103,14 +124,17 @@ def get_task_status(request, task_id):
     """
     try:
         task_result = AsyncResult(task_id, app=celery_app)
+        # one backend read: ready/successful/failed all derive from the state
+        task_state = task_result.state
+        ready = task_state in READY_STATES
         
         return Response({
             'task_id': task_id,
-            'status': task_result.status,
-            'result': task_result.result if task_result.ready() else None,
-            'ready': task_result.ready(),
-            'successful': task_result.successful() if task_result.ready() else None,
-            'failed': task_result.failed() if task_result.ready() else None,
+            'status': task_state,
+            'result': task_result.result if ready else None,
+            'ready': ready,
+            'successful': task_state == SUCCESS if ready else None,
+            'failed': task_state == FAILURE if ready else None,
         })
         
     except Exception as e:
@@ -127,17 +151,19 @@ def list_active_tasks(request):
     GET /api/tasks/active/
     """
     try:
-        # Get active tasks
-        inspect = celery_app.control.inspect()
-        active_tasks = inspect.active()
-        
-        # Get scheduled tasks
-        scheduled_tasks = inspect.scheduled()
+        # Both calls broadcast to every worker; polling dashboards share one answer per TTL
+        data = cache.get(_INSPECT_CACHE_KEY)
+        if data is None:
+            inspect = celery_app.control.inspect(timeout=0.5)
+            data = {
+                'active_tasks': inspect.active(),
+                'scheduled_tasks': inspect.scheduled(),
+            }
+            cache.set(_INSPECT_CACHE_KEY, data, timeout=settings.TASKS_INSPECT_CACHE_TTL)
         
         return Response({
-            'active_tasks': active_tasks,
-            'scheduled_tasks': scheduled_tasks,
-            'total_workers': len(active_tasks) if active_tasks else 0
+            **data,
+            'total_workers': len(data['active_tasks']) if data['active_tasks'] else 0
         })
         
     except Exception as e:
@@ -177,14 +203,7 @@ def trigger_task_from_code(task_name, *args, **kwargs):
     from configurations.task_views import trigger_task_from_code
     result = trigger_task_from_code('sample_async_task', message="Hello from code")
     """
-    task_mapping = {
-        'sample_async_task': sample_async_task,
-        'on_demand_error_log': on_demand_error_log,
-        'robust_background_task': robust_background_task,
-    }
-    
-    task_func = task_mapping.get(task_name)
-    if task_func:
-        return task_func.delay(*args, **kwargs)
-    else:
-        raise ValueError(f"Task '{task_name}' not found. Available tasks: {list(task_mapping.keys())}") 
\ No newline at end of file
+    task_func = _TASK_MAPPING.get(task_name)
+    if task_func is None:
+        raise ValueError(f"Task '{task_name}' not found. Available tasks: {list(_TASK_MAPPING)}")
+    return task_func.delay(*args, **kwargs)
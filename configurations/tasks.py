@@ -1,11 +1,32 @@
 import logging
-from celery import shared_task
+from celery import chord, shared_task
+from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
 from datetime import datetime
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Dropped by the Tenant save/delete signals in core.signals; the workers see that
+# only because the default cache is shared (Redis, see settings_details/django/cache.py)
+TENANT_SCHEMAS_CACHE_KEY = "tenant_schemas"
+
+
+def tenant_schema_names():
+    """
+    Schema names of all tenants except public, cached for TENANT_SCHEMAS_CACHE_TTL
+    so the periodic PM checks do not query the tenant table on every run.
+    """
+    schema_names = cache.get(TENANT_SCHEMAS_CACHE_KEY)
+    if schema_names is None:
+        from django_tenants.utils import get_tenant_model
+        schema_names = list(
+            get_tenant_model().objects.exclude(schema_name='public').values_list('schema_name', flat=True)
+        )
+        cache.set(TENANT_SCHEMAS_CACHE_KEY, schema_names, timeout=settings.TENANT_SCHEMAS_CACHE_TTL)
+    return schema_names
+
 @shared_task(bind=True)
 def log_error_task(self):
     """
@@ -89,66 +110,109 @@ def on_demand_error_log(custom_message="On-demand error triggered"):
         'timestamp': current_time
     }
 
+def _check_calendar_pms_due():
+    from pm_automation.calendar_service import CalendarPMService
+    return CalendarPMService.check_calendar_pms_due()
+
+
+def _check_overdue_meter_pms():
+    from pm_automation.services import PMAutomationService
+    return PMAutomationService.check_overdue_meter_pms()
+
+
+# Per-tenant PM checks, keyed by the name the fan-out tasks pass around:
+# (service call, log prefix, what is being checked)
+_PM_CHECKS = {
+    'calendar': (_check_calendar_pms_due, '📅', 'calendar PM'),
+    'overdue_meter': (_check_overdue_meter_pms, '⚙️', 'overdue meter PM'),
+}
+
+
+def _dispatch_pm_check(task, check):
+    """
+    Fan the `check` out as one task per tenant schema and collect the results
+    with a chord callback, so tenants run in parallel across the workers and a
+    slow or failing tenant no longer holds up the others.
+    """
+    schema_names = tenant_schema_names()
+    if not schema_names:
+        return summarize_pm_check([], check, task.request.id)
+    result = chord(
+        check_pm_for_tenant.s(schema_name, check) for schema_name in schema_names
+    )(summarize_pm_check.s(check, task.request.id))
+    return {
+        'status': 'dispatched',
+        'tenants': len(schema_names),
+        'summary_task_id': result.id,
+        'timestamp': timezone.now().isoformat(),
+        'task_id': task.request.id
+    }
+
+
+@shared_task
+def check_pm_for_tenant(schema_name, check):
+    """
+    Run one PM check inside one tenant schema; errors are reported, not raised,
+    so the chord completes. With TENANT_LIMIT_SET_CALLS the search_path is SET
+    once on entering the schema, not again before every query in the check.
+    """
+    from django_tenants.utils import schema_context
+    
+    run_check, icon, label = _PM_CHECKS[check]
+    try:
+        with schema_context(schema_name):
+            print(f"{icon} Checking {label}s for tenant: {schema_name}")
+            created_work_orders = run_check()
+    except Exception as tenant_exc:
+        logger.error(f"Error checking {label}s for tenant {schema_name}: {str(tenant_exc)}")
+        return {'schema_name': schema_name, 'error': str(tenant_exc)}
+    
+    if created_work_orders:
+        logger.info(f"{icon} Created {len(created_work_orders)} {label} work orders for tenant {schema_name}")
+        print(f"{icon} Tenant {schema_name}: Created {len(created_work_orders)} work orders")
+    else:
+        print(f"{icon} Tenant {schema_name}: No {label} work orders due")
+    return {
+        'schema_name': schema_name,
+        'work_orders_created': len(created_work_orders or ()),
+        'work_order_ids': [str(wo.id) for wo in created_work_orders or ()]
+    }
+
+
+@shared_task
+def summarize_pm_check(tenant_results, check, dispatch_task_id=None):
+    """Chord callback: fold the per-tenant results into the PM check summary"""
+    _, icon, label = _PM_CHECKS[check]
+    total_work_orders = 0
+    by_tenant = {}
+    for tenant_result in tenant_results:
+        schema_name = tenant_result.pop('schema_name')
+        if tenant_result.get('work_orders_created') or 'error' in tenant_result:
+            by_tenant[schema_name] = tenant_result
+        total_work_orders += tenant_result.get('work_orders_created', 0)
+    
+    if total_work_orders:
+        logger.info(f"{icon} Total: Created {total_work_orders} {label} work orders across {len(tenant_results)} tenants")
+    print(f"{icon} {label} check complete: {total_work_orders} work orders created across {len(tenant_results)} tenants")
+    return {
+        'status': 'completed',
+        'total_work_orders_created': total_work_orders,
+        'tenants_processed': len(tenant_results),
+        'tenant_results': by_tenant,
+        'timestamp': timezone.now().isoformat(),
+        'task_id': dispatch_task_id
+    }
+
+
 @shared_task(bind=True)
 def check_calendar_pms(self):
     """
     Celery task to check for due calendar PMs
     Runs every 15 minutes to check for calendar-based PM work orders that need to be created
-    Multi-tenant aware: checks all tenant schemas
+    Multi-tenant aware: dispatches one check_pm_for_tenant per tenant schema
     """
     try:
-        from pm_automation.calendar_service import CalendarPMService
-        from django_tenants.utils import get_tenant_model, schema_context
-        from django.db import connection
-        
-        total_work_orders = []
-        tenant_results = {}
-        
-        # Get all tenant schemas (exclude public schema since pm_automation is a TENANT_APP)
-        tenant_model = get_tenant_model()
-        tenants = tenant_model.objects.exclude(schema_name='public')
-        
-        for tenant in tenants:
-            try:
-                # Switch to tenant schema
-                with schema_context(tenant.schema_name):
-                    print(f"📅 Checking calendar PMs for tenant: {tenant.schema_name}")
-                    
-                    # Check calendar PMs for this tenant
-                    created_work_orders = CalendarPMService.check_calendar_pms_due()
-                    
-                    if created_work_orders:
-                        total_work_orders.extend(created_work_orders)
-                        tenant_results[tenant.schema_name] = {
-                            'work_orders_created': len(created_work_orders),
-                            'work_order_ids': [str(wo.id) for wo in created_work_orders]
-                        }
-                        logger.info(f"📅 Created {len(created_work_orders)} calendar PM work orders for tenant {tenant.schema_name}")
-                        print(f"📅 Tenant {tenant.schema_name}: Created {len(created_work_orders)} work orders")
-                    else:
-                        print(f"📅 Tenant {tenant.schema_name}: No work orders due")
-                        
-            except Exception as tenant_exc:
-                logger.error(f"Error checking calendar PMs for tenant {tenant.schema_name}: {str(tenant_exc)}")
-                tenant_results[tenant.schema_name] = {'error': str(tenant_exc)}
-        
-        result = {
-            'status': 'completed',
-            'total_work_orders_created': len(total_work_orders),
-            'tenants_processed': len(tenants),
-            'tenant_results': tenant_results,
-            'timestamp': timezone.now().isoformat(),
-            'task_id': self.request.id
-        }
-        
-        if total_work_orders:
-            logger.info(f"📅 Total: Created {len(total_work_orders)} calendar PM work orders across {len(tenants)} tenants")
-            print(f"📅 Calendar PM Check Complete: {len(total_work_orders)} work orders created across {len(tenants)} tenants")
-        else:
-            print(f"📅 Calendar PM Check Complete: No work orders due across {len(tenants)} tenants at {timezone.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        
-        return result
-        
+        return _dispatch_pm_check(self, 'calendar')
     except Exception as exc:
         logger.error(f"Error in calendar PM check task: {str(exc)}")
         raise self.retry(exc=exc)
@@ -159,61 +223,10 @@ def check_overdue_meter_pms(self):
     Daily Celery task to check for overdue meter-based PMs
     Runs once per day to check for meter-based PM work orders that should have been created
     but might have been missed (e.g., if no new meter readings were entered)
-    Multi-tenant aware: checks all tenant schemas
+    Multi-tenant aware: dispatches one check_pm_for_tenant per tenant schema
     """
     try:
-        from pm_automation.services import PMAutomationService
-        from django_tenants.utils import get_tenant_model, schema_context
-        from django.db import connection
-        
-        total_work_orders = []
-        tenant_results = {}
-        
-        # Get all tenant schemas (exclude public schema since pm_automation is a TENANT_APP)
-        tenant_model = get_tenant_model()
-        tenants = tenant_model.objects.exclude(schema_name='public')
-        
-        for tenant in tenants:
-            try:
-                # Switch to tenant schema
-                with schema_context(tenant.schema_name):
-                    print(f"⚙️ Checking overdue meter PMs for tenant: {tenant.schema_name}")
-                    
-                    # Check overdue meter PMs for this tenant
-                    created_work_orders = PMAutomationService.check_overdue_meter_pms()
-                    
-                    if created_work_orders:
-                        total_work_orders.extend(created_work_orders)
-                        tenant_results[tenant.schema_name] = {
-                            'work_orders_created': len(created_work_orders),
-                            'work_order_ids': [str(wo.id) for wo in created_work_orders]
-                        }
-                        logger.info(f"⚙️ Created {len(created_work_orders)} overdue meter PM work orders for tenant {tenant.schema_name}")
-                        print(f"⚙️ Tenant {tenant.schema_name}: Created {len(created_work_orders)} overdue work orders")
-                    else:
-                        print(f"⚙️ Tenant {tenant.schema_name}: No overdue meter PMs found")
-                        
-            except Exception as tenant_exc:
-                logger.error(f"Error checking overdue meter PMs for tenant {tenant.schema_name}: {str(tenant_exc)}")
-                tenant_results[tenant.schema_name] = {'error': str(tenant_exc)}
-        
-        result = {
-            'status': 'completed',
-            'total_work_orders_created': len(total_work_orders),
-            'tenants_processed': len(tenants),
-            'tenant_results': tenant_results,
-            'timestamp': timezone.now().isoformat(),
-            'task_id': self.request.id
-        }
-        
-        if total_work_orders:
-            logger.info(f"⚙️ Total: Created {len(total_work_orders)} overdue meter PM work orders across {len(tenants)} tenants")
-            print(f"⚙️ Overdue Meter PM Check Complete: {len(total_work_orders)} work orders created across {len(tenants)} tenants")
-        else:
-            print(f"⚙️ Overdue Meter PM Check Complete: No overdue PMs found across {len(tenants)} tenants at {timezone.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        
-        return result
-        
+        return _dispatch_pm_check(self, 'overdue_meter')
     except Exception as exc:
         logger.error(f"Error in overdue meter PM check task: {str(exc)}")
-        raise self.retry(exc=exc) 
\ No newline at end of file
+        raise self.retry(exc=exc)
@@ -8,9 +8,13 @@ from core.models import Tenant, Domain
 from django.conf import settings
 from configurations.serializers import *
 
+# once a tenant exists it stays that way, so each process checks the table only until it sees one
+_SYSTEM_READY = False
+
+
 def index(request):
-    is_system_ready = Tenant.objects.exists()
-    if not is_system_ready:
+    global _SYSTEM_READY
+    if not _SYSTEM_READY and not Tenant.objects.exists():
 
         # create your public tenant
         tenant = Tenant(schema_name='public',
@@ -25,6 +29,7 @@ def index(request):
         domain.tenant = tenant
         domain.is_primary = True
         domain.save()
+    _SYSTEM_READY = True
     return HttpResponse(f"{request.tenant.name} INDEX")
 
 class DashboardApiView(BaseAPIView):
@@ -8,4 +8,8 @@ class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
 
+    def ready(self) -> None:
+        from core import signals  # noqa
+        return super().ready()
+
     
\ No newline at end of file
@@ -0,0 +1,23 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from core.models import Domain, Tenant
+from configurations.tasks import TENANT_SCHEMAS_CACHE_KEY
+from configurations.base_features.middlewares.subdomain_middleware import (
+    forget_local_tenants, tenant_cache_key, tenant_miss_cache_key,
+)
+
+
+@receiver(post_save, sender=Tenant)
+@receiver(post_delete, sender=Tenant)
+def clear_tenant_cache(sender, instance, **kwargs):
+    hostnames = list(Domain.objects.filter(tenant_id=instance.pk).values_list("domain", flat=True))
+    cache.delete_many([TENANT_SCHEMAS_CACHE_KEY, *(tenant_cache_key(hostname) for hostname in hostnames)])
+    forget_local_tenants(hostnames)
+
+
+@receiver(post_save, sender=Domain)
+@receiver(post_delete, sender=Domain)
+def clear_domain_cache(sender, instance, **kwargs):
+    cache.delete_many([tenant_cache_key(instance.domain), tenant_miss_cache_key(instance.domain)])
+    forget_local_tenants([instance.domain])
@@ -7,7 +7,6 @@ from rest_framework_simplejwt.views import (
     TokenVerifyView
 )
 
-from configurations.system_start_checks import system_start_checks
 from django.conf.urls.static import static
 from django.conf import settings
 
@@ -27,4 +26,4 @@ urlpatterns = [
 urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT) 
 urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
 
-# system_start_checks()
+# provisioning (system_start_checks) runs from `manage.py bootstrap_system`, not on URLconf import
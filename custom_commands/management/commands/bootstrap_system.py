@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+
+from configurations.system_start_checks import system_start_checks
+
+
+class Command(BaseCommand):
+    help = "Provision the public tenant, default status controls and system users (run once per deploy)"
+
+    def handle(self, *args, **options):
+        system_start_checks()
@@ -89,6 +89,7 @@ echo "REDIS_HOST=$(curl -s http://169.254.169.254/latest/meta-data/local-ipv4)"
 echo "REDIS_PASSWORD=$(grep requirepass /etc/redis/redis.conf | cut -d' ' -f2)"
 echo "REDIS_PORT=6379"
 echo "REDIS_DB=0"
+echo "REDIS_CACHE_DB=1"
 
 echo -e "${GREEN}🎉 Redis deployment completed successfully!${NC}"
 echo -e "${YELLOW}📖 Next steps:${NC}"
@@ -60,6 +60,7 @@ docker run -d \
   -e REDIS_PORT=6379 \
   -e REDIS_PASSWORD="${REDIS_PASSWORD}" \
   -e REDIS_DB=0 \
+  -e REDIS_CACHE_DB=1 \
   -e DJANGO_SETTINGS_MODULE=configurations.settings \
   --restart unless-stopped \
   tenmil-app \
@@ -75,6 +76,7 @@ docker run -d \
   -e REDIS_PORT=6379 \
   -e REDIS_PASSWORD="${REDIS_PASSWORD}" \
   -e REDIS_DB=0 \
+  -e REDIS_CACHE_DB=1 \
   -e DJANGO_SETTINGS_MODULE=configurations.settings \
   --restart unless-stopped \
   tenmil-app \
@@ -91,6 +93,7 @@ docker run -d \
   -e REDIS_PORT=6379 \
   -e REDIS_PASSWORD="${REDIS_PASSWORD}" \
   -e REDIS_DB=0 \
+  -e REDIS_CACHE_DB=1 \
   --restart unless-stopped \
   tenmil-app \
   python -m celery -A configurations flower --broker="redis://:${REDIS_PASSWORD}@tenmil-redis:6379/0"
@@ -111,6 +114,7 @@ echo "REDIS_HOST=localhost  # or tenmil-redis from within containers"
 echo "REDIS_PORT=6379"
 echo "REDIS_PASSWORD=${REDIS_PASSWORD}"
 echo "REDIS_DB=0"
+echo "REDIS_CACHE_DB=1"
 echo ""
 echo -e "${BLUE}🛠️  Useful Commands:${NC}"
 echo "docker logs tenmil-celery-worker -f     # View worker logs"
@@ -18,6 +18,9 @@ export DJANGO_CONFIGURATION=Production  # or Dev, Staging, etc.
 echo "collect statics"
 python3 manage.py collectstatic --noinput
 
+echo "bootstrap system data"
+python3 manage.py bootstrap_system
+
 echo "Starting Server..."
 # exec python3 manage.py runserver 0.0.0.0:8000
 exec gunicorn configurations.wsgi:application -c configurations/gunicorn.conf.py
@@ -11,5 +11,5 @@ class FaultCodeBaseSerializer(BaseSerializer):
 
     def to_representation(self, instance):
         response = super().to_representation(instance)
-        response['created_by'] = TenantUserBaseSerializer(instance.created_by).data
+        response['created_by'] = TenantUserBaseSerializer.represent(instance.created_by)
         return response
\ No newline at end of file
@@ -85,8 +85,7 @@ class FileUploadAdmin(admin.ModelAdmin):
     
     def soft_delete(self, request, queryset):
         """Soft delete selected files"""
-        from django.utils import timezone
-        updated = queryset.update(is_deleted=True, deleted_at=timezone.now())
+        updated = FileUpload.objects.soft_delete(pk__in=queryset.values('pk'))
         self.message_user(request, f'{updated} files soft deleted.')
     soft_delete.short_description = 'Soft delete selected files'
     
@@ -85,9 +85,7 @@ class Command(BaseCommand):
         
         if not options['dry_run']:
             if options['force'] or self._confirm("Mark these records as deleted?"):
-                for file_obj in missing_files:
-                    file_obj.is_deleted = True
-                    file_obj.save()
+                FileUpload.objects.soft_delete(pk__in=[file_obj.pk for file_obj in missing_files])
                 self.stdout.write(
                     self.style.SUCCESS(f"Marked {len(missing_files)} records as deleted.")
                 )
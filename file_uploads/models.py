@@ -1,6 +1,7 @@
 import os
 import uuid
 from django.db import models
+from django.db.models import Q
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from configurations.base_features.db.base_model import BaseModel
@@ -147,6 +148,14 @@ class FileUpload(BaseModel):
             models.Index(fields=['is_deleted']),
             models.Index(fields=['validation_status']),
             models.Index(fields=['file_hash']),
+            # live files of one object: every not_deleted() lookup through a GenericRelation
+            models.Index(
+                fields=['content_type_ref', 'object_id'],
+                condition=Q(is_deleted=False),
+                name='fileupload_active_idx',
+            ),
+            # images()/documents() narrowing on top of not_deleted()
+            models.Index(fields=['content_type', 'is_deleted'], name='fileupload_type_del_idx'),
         ]
     
     def __str__(self):
@@ -226,6 +235,18 @@ class FileUpload(BaseModel):
         return None
 
 
+IMAGE_CONTENT_TYPES = ('image/jpeg', 'image/png', 'image/gif', 'image/webp', 'image/svg+xml')
+DOCUMENT_CONTENT_TYPES = (
+    'application/pdf',
+    'application/msword',
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    'application/vnd.ms-excel',
+    'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'text/plain',
+    'text/csv'
+)
+
+
 class FileUploadQuerySet(models.QuerySet):
     """Custom QuerySet for FileUpload with chainable methods"""
     
@@ -245,21 +266,11 @@ class FileUploadQuerySet(models.QuerySet):
     
     def images(self):
         """Return only image files"""
-        image_types = ['image/jpeg', 'image/png', 'image/gif', 'image/webp', 'image/svg+xml']
-        return self.filter(content_type__in=image_types)
+        return self.filter(content_type__in=IMAGE_CONTENT_TYPES)
     
     def documents(self):
         """Return only document files"""
-        doc_types = [
-            'application/pdf',
-            'application/msword',
-            'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-            'application/vnd.ms-excel',
-            'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            'text/plain',
-            'text/csv'
-        ]
-        return self.filter(content_type__in=doc_types)
+        return self.filter(content_type__in=DOCUMENT_CONTENT_TYPES)
 
 
 class FileUploadManager(BaseManager):
@@ -0,0 +1,29 @@
+from django.test import TestCase
+
+from components.models import Component
+from configurations.base_features.exceptions.base_exceptions import LocalBaseException
+from file_uploads.models import FileUpload
+
+
+class SoftDeleteTestCase(TestCase):
+    """BaseManager.soft_delete, as used by the admin action and cleanup_files --missing"""
+
+    def setUp(self):
+        self.files = [
+            FileUpload.objects.create(original_filename=f'file_{index}.txt', file_size=1, content_type='text/plain')
+            for index in range(3)
+        ]
+
+    def test_soft_delete_marks_only_matching_rows(self):
+        before = FileUpload.objects.get(pk=self.files[0].pk)
+        deleted = FileUpload.objects.soft_delete(pk__in=[self.files[0].pk, self.files[1].pk])
+
+        self.assertEqual(deleted, 2)
+        self.assertEqual(FileUpload.objects.not_deleted().get().pk, self.files[2].pk)
+        after = FileUpload.objects.get(pk=self.files[0].pk)
+        self.assertIsNotNone(after.deleted_at)
+        self.assertGreater(after.updated_at, before.updated_at)
+
+    def test_soft_delete_requires_is_deleted_field(self):
+        with self.assertRaises(LocalBaseException):
+            Component.objects.soft_delete()
@@ -20,4 +20,10 @@ class MeterReading(BaseModel):
         except Exception:
             return f"{self.content_type.app_label}.{self.content_type.model}.{self.object_id} - {self.meter_reading}"
 
+    class Meta:
+        indexes = [
+            # latest reading of one asset (component meter readings, component ETags)
+            models.Index(fields=['content_type', 'object_id', '-created_at'], name='meterreading_latest_idx'),
+        ]
+
 
@@ -10,5 +10,5 @@ class MeterReadingBaseSerializer(BaseSerializer):
 
     def to_representation(self, instance):
         response = super().to_representation(instance)
-        response['created_by'] = TenantUserBaseSerializer(instance.created_by).data
+        response['created_by'] = TenantUserBaseSerializer.represent(instance.created_by)
         return response
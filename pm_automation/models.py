@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
 from configurations.base_features.db.base_model import BaseModel
 from django.contrib.contenttypes.fields import GenericForeignKey
@@ -116,6 +117,11 @@ class PMSettings(BaseModel):
     class Meta:
         verbose_name = _("PM Settings")
         verbose_name_plural = _("PM Settings")
+        indexes = [
+            # partial indexes: the PM services only ever read the enabled settings
+            models.Index(fields=['content_type', 'object_id'], condition=Q(is_active=True), name='pmsettings_asset_active_idx'),
+            models.Index(fields=['trigger_type'], condition=Q(is_active=True), name='pmsettings_trigger_active_idx'),
+        ]
     
     def __str__(self):
         try:
@@ -0,0 +1,51 @@
+import re
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from work_orders.models import WorkOrder
+
+
+class Command(BaseCommand):
+    help = 'Assign WO_<n> codes to work orders created before codes were generated on save'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Show how many work orders would be updated without making changes',
+        )
+
+    def handle(self, *args, **options):
+        missing = WorkOrder.objects.filter(code__isnull=True) | WorkOrder.objects.filter(code='')
+        missing_count = missing.count()
+        self.stdout.write(f'Work orders without a code: {missing_count}')
+
+        if missing_count == 0:
+            self.stdout.write(self.style.SUCCESS('No records need fixing!'))
+            return
+
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING(f'[DRY RUN] Would assign codes to {missing_count} work orders'))
+            return
+
+        with transaction.atomic():
+            # Block concurrent inserts/updates (WorkOrder.save() picking the next WO_<n>)
+            # until the backfill commits; reads keep working
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f'LOCK TABLE {connection.ops.quote_name(WorkOrder._meta.db_table)} IN SHARE ROW EXCLUSIVE MODE'
+                )
+
+            # Continue numbering after the highest existing WO_<n> code
+            max_number = 0
+            for code in WorkOrder.objects.filter(code__startswith='WO_').values_list('code', flat=True):
+                match = re.match(r'WO_(\d+)$', code)
+                if match:
+                    max_number = max(max_number, int(match.group(1)))
+
+            work_orders = list(missing.order_by('created_at').only('id', 'code'))
+            for number, work_order in enumerate(work_orders, start=max_number + 1):
+                work_order.code = f'WO_{number}'
+            WorkOrder.objects.bulk_update(work_orders, ['code'], batch_size=1000)
+
+        self.stdout.write(self.style.SUCCESS(f'Updated {len(work_orders)} records'))
@@ -27,11 +27,11 @@ class WorkOrderBaseSerializer(BaseSerializer):
         response = super().to_representation(instance)
         asset = get_object_by_content_type_and_id(instance.content_type.id, instance.object_id)
         response['asset'] = get_asset_serializer(asset).data
-        response['status'] = WorkOrderStatusNamesBaseSerializer(instance.status).data
+        response['status'] = WorkOrderStatusNamesBaseSerializer.represent(instance.status)
         if instance.maint_type:
-            response['maint_type'] = MaintenanceTypeBaseSerializer(instance.maint_type).data
+            response['maint_type'] = MaintenanceTypeBaseSerializer.represent(instance.maint_type)
         if instance.priority:
-            response['priority'] = PriorityBaseSerializer(instance.priority).data
+            response['priority'] = PriorityBaseSerializer.represent(instance.priority)
         return response
 
 
@@ -54,9 +54,9 @@ class WorkOrderChecklistBaseSerializer(BaseSerializer):
 
     def to_representation(self, instance):
         response = super().to_representation(instance)
-        response['work_order'] = WorkOrderBaseSerializer(instance.work_order).data
+        response['work_order'] = WorkOrderBaseSerializer.represent(instance.work_order)
         if instance.completed_by:
-            response['completed_by'] = TenantUserBaseSerializer(instance.completed_by).data
+            response['completed_by'] = TenantUserBaseSerializer.represent(instance.completed_by)
         else:
             response['completed_by'] = None
         return response
@@ -68,8 +68,8 @@ class WorkOrderLogBaseSerializer(BaseSerializer):
 
     def to_representation(self, instance):
         response = super().to_representation(instance)
-        response['work_order'] = WorkOrderBaseSerializer(instance.work_order).data
-        response['user'] =  TenantUserBaseSerializer(instance.user).data
+        response['work_order'] = WorkOrderBaseSerializer.represent(instance.work_order)
+        response['user'] =  TenantUserBaseSerializer.represent(instance.user)
         return response
 
 
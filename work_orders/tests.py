@@ -1,12 +1,16 @@
+from io import StringIO
+from django.core.management import call_command
 from django.test import TestCase
 from django.urls import reverse
 from rest_framework.test import APITestCase
 from rest_framework import status
 from django.contrib.contenttypes.models import ContentType
-from work_orders.models import WorkOrder, WorkOrderChecklist, WorkOrderStatusNames
+from work_orders.models import WorkOrder, WorkOrderChecklist, WorkOrderMiscCost, WorkOrderStatusNames
+from work_orders.platforms.base.views import WorkOrderMiscCostBaseView
 from tenant_users.models import TenantUser
 from core.models import WorkOrderStatusControls
 from datetime import datetime, timezone
+from decimal import Decimal
 import json
 
 
@@ -370,3 +374,80 @@ class WorkOrderNestedLookupTestCase(TestCase):
             import traceback
             traceback.print_exc()
             raise
+
+
+class FlatListRowsTestCase(TestCase):
+    """get_flat_rows must return exactly what the serializer renders for a list"""
+
+    def setUp(self):
+        control = WorkOrderStatusControls.objects.create(key='active', name='Active', color='#4caf50', order=1)
+        status_name = WorkOrderStatusNames.objects.create(name='Active', control=control)
+        self.work_order = WorkOrder.objects.create(
+            content_type=ContentType.objects.get_for_model(WorkOrder),
+            object_id='12345678-1234-1234-1234-123456789012',
+            status=status_name,
+            description='Work order with misc costs'
+        )
+        for total_cost in ('12.50', '0.99'):
+            WorkOrderMiscCost.objects.create(
+                work_order=self.work_order,
+                total_cost=Decimal(total_cost),
+                description=f'Misc cost {total_cost}'
+            )
+
+    def test_flat_rows_match_serializer(self):
+        """UUID id, FK id, decimal and datetime columns come out identical and in the same order"""
+        view = WorkOrderMiscCostBaseView()
+        instances = view.get_queryset()
+
+        flat_rows = view.get_flat_rows(instances)
+        serialized = view.serializer_class(instances, many=True).data
+
+        self.assertIsNotNone(flat_rows)
+        self.assertEqual(len(flat_rows), 2)
+        for flat_row, serialized_row in zip(flat_rows, serialized):
+            self.assertEqual(list(flat_row), list(serialized_row))
+            self.assertEqual(flat_row, dict(serialized_row))
+            self.assertEqual(flat_row['work_order'], self.work_order.pk)
+            self.assertIsInstance(flat_row['id'], str)
+
+
+class BackfillWorkOrderCodesTestCase(TestCase):
+    """Test cases for the backfill_work_order_codes management command"""
+
+    def setUp(self):
+        control = WorkOrderStatusControls.objects.create(key='active', name='Active', color='#4caf50', order=1)
+        self.status = WorkOrderStatusNames.objects.create(name='Active', control=control)
+        self.numbered = self.create_work_order('WO_5')
+        self.without_code = self.create_work_order(None)
+        self.empty_code = self.create_work_order('')
+
+    def create_work_order(self, code):
+        work_order = WorkOrder.objects.create(
+            content_type=ContentType.objects.get_for_model(WorkOrder),
+            object_id='12345678-1234-1234-1234-123456789012',
+            status=self.status,
+            description=f'Work order {code!r}'
+        )
+        # save() always assigns a code, so set the legacy value directly
+        WorkOrder.objects.filter(pk=work_order.pk).update(code=code)
+        return work_order
+
+    def codes(self):
+        return [
+            WorkOrder.objects.get(pk=work_order.pk).code
+            for work_order in (self.numbered, self.without_code, self.empty_code)
+        ]
+
+    def test_backfill_continues_after_highest_code(self):
+        """NULL and empty codes are numbered after WO_5, oldest work order first"""
+        call_command('backfill_work_order_codes', stdout=StringIO())
+
+        self.assertEqual(self.codes(), ['WO_5', 'WO_6', 'WO_7'])
+
+    def test_dry_run_writes_nothing(self):
+        out = StringIO()
+        call_command('backfill_work_order_codes', '--dry-run', stdout=out)
+
+        self.assertEqual(self.codes(), ['WO_5', None, ''])
+        self.assertIn('Would assign codes to 2 work orders', out.getvalue())